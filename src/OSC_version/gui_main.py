@@ -22,14 +22,84 @@ All continuous parameters use the same ParameterSlider widget.
 
 from __future__ import annotations
 
-from typing import Dict
+from typing import TYPE_CHECKING, Dict, List
 
-from PyQt6 import QtWidgets, QtCore
+from PyQt6 import QtGui, QtWidgets, QtCore
 
 from sc_synth_controller import SuperColliderSynthController
-from midi_input import MidiInputManager
 from piano_widget import PianoWidget
-from preset_manager import SynthPresetManager
+
+if TYPE_CHECKING:
+    # Imported lazily at runtime (MIDI in _setup_midi, presets on first
+    # save/load) so the window can paint before mido/rtmidi load.
+    from midi_input import MidiInputManager
+    from preset_manager import SynthPresetManager
+
+
+# Slider handle color per parameter bank. ParameterSlider uses the bank
+# name as the QSlider object name, and the window installs one shared
+# stylesheet (SLIDER_STYLESHEET) covering every bank.
+SLIDER_HANDLE_COLORS: Dict[str, str] = {
+    "vco": "#3f88ff",
+    "filter": "#ff8800",
+    "lfo": "#aa44ff",
+    "env": "#44aa44",
+    "amp": "#222222",
+}
+
+SLIDER_STYLESHEET = """
+    QSlider::groove:vertical {
+        background: #e0e0e0;
+        border: 1px solid #b0b0b0;
+        width: 10px;
+        margin: 5px 0;
+    }
+    QSlider::handle:vertical {
+        border: 1px solid #444444;
+        height: 16px;
+        margin: -4px -8px;
+        border-radius: 3px;
+    }
+""" + "".join(
+    f"QSlider#{bank}::handle:vertical {{ background: {color}; }}\n"
+    for bank, color in SLIDER_HANDLE_COLORS.items()
+)
+
+
+class ParameterStore:
+    """
+    ParameterStore
+    ==============
+
+    Shared value store for the front-panel ParameterSliders.
+
+    Every slider owns one index into parallel lists (names, values, mins,
+    ranges). Panel-wide reads such as preset save or the note-on
+    voice_init snapshot become a single zip over two lists instead of a
+    get_value() call per widget.
+    """
+
+    def __init__(self) -> None:
+        self.names: List[str] = []
+        self.values: List[float] = []
+        self.mins: List[float] = []
+        self.ranges: List[float] = []
+
+    def add(self, name: str, min_val: float, max_val: float, value: float) -> int:
+        """
+        Register a parameter and return its index.
+        """
+        self.names.append(name)
+        self.values.append(float(value))
+        self.mins.append(float(min_val))
+        self.ranges.append(float(max_val) - float(min_val))
+        return len(self.names) - 1
+
+    def as_dict(self) -> Dict[str, float]:
+        """
+        Return {param_name: value} for every registered parameter.
+        """
+        return dict(zip(self.names, self.values))
 
 
 class ParameterSlider(QtWidgets.QWidget):
@@ -44,10 +114,34 @@ class ParameterSlider(QtWidgets.QWidget):
 
     Emits:
         valueChanged(str param_name, float value)
+
+    The value label is not redrawn on every slider tick; moved sliders
+    are marked dirty and refreshed by refresh_dirty_labels(), which the
+    window drives from a display-rate timer.
     """
 
     valueChanged = QtCore.pyqtSignal(str, float)  # (param_name, value)
 
+    # Sliders whose label text is stale (shared by all instances)
+    _dirty: "set[ParameterSlider]" = set()
+
+    # Label font and slider size policy shared by all instances; built on
+    # first construction (QFont needs the QApplication to exist).
+    _label_font: QtGui.QFont | None = None
+    _slider_policy: QtWidgets.QSizePolicy | None = None
+
+    @classmethod
+    def _shared_style(cls) -> tuple[QtGui.QFont, QtWidgets.QSizePolicy]:
+        if cls._label_font is None:
+            font = QtGui.QFont()
+            font.setPointSize(9)
+            cls._label_font = font
+            cls._slider_policy = QtWidgets.QSizePolicy(
+                QtWidgets.QSizePolicy.Policy.Preferred,
+                QtWidgets.QSizePolicy.Policy.Expanding,
+            )
+        return cls._label_font, cls._slider_policy
+
     def __init__(
         self,
         label_text: str,
@@ -55,14 +149,32 @@ class ParameterSlider(QtWidgets.QWidget):
         min_val: float,
         max_val: float,
         default: float,
-        color: str,
+        bank: str,
+        store: ParameterStore | None = None,
+        steps: int = 200,
         parent=None,
     ):
+        """
+        bank selects the handle color (a key of SLIDER_HANDLE_COLORS).
+        store is the ParameterStore holding the slider's value; a private
+        one is created if omitted.
+        steps is the number of slider positions across the travel; 200 is
+        finer than the ear can follow and keeps a drag from emitting a
+        change for every pixel.
+        """
         super().__init__(parent)
 
         self.param_name = param_name
         self.min_val = float(min_val)
         self.max_val = float(max_val)
+        self._range = self.max_val - self.min_val
+        self._steps = int(steps)
+        # slider position (0..steps) <-> value scale factors
+        self._scale = self._range / self._steps
+        self._inv_range = self._steps / self._range
+
+        self._store = store if store is not None else ParameterStore()
+        self._index = self._store.add(param_name, min_val, max_val, default)
 
         # Fixed-ish width so faders pack tightly and evenly.
         self.setFixedWidth(80)
@@ -75,34 +187,27 @@ class ParameterSlider(QtWidgets.QWidget):
         self.label = QtWidgets.QLabel()
         self.label.setAlignment(QtCore.Qt.AlignmentFlag.AlignHCenter)
         self.label.setStyleSheet("color: black;")
-        font = self.label.font()
-        font.setPointSize(9)
-        self.label.setFont(font)
+        label_font, slider_policy = self._shared_style()
+        self.label.setFont(label_font)
 
         self.slider = QtWidgets.QSlider(QtCore.Qt.Orientation.Vertical)
-        self.slider.setRange(0, 1000)
+        self.slider.setSizePolicy(slider_policy)
+        self.slider.setRange(0, self._steps)
+        self.slider.setSingleStep(1)
+        self.slider.setPageStep(max(1, self._steps // 10))
         self.slider.setMinimumHeight(140)
-
-        self.slider.setStyleSheet(f"""
-            QSlider::groove:vertical {{
-                background: #e0e0e0;
-                border: 1px solid #b0b0b0;
-                width: 10px;
-                margin: 5px 0;
-            }}
-            QSlider::handle:vertical {{
-                background: {color};
-                border: 1px solid #444444;
-                height: 16px;
-                margin: -4px -8px;
-                border-radius: 3px;
-            }}
-        """)
+        self.slider.setObjectName(bank)
 
         layout.addWidget(self.label)
         layout.addWidget(self.slider, 1, QtCore.Qt.AlignmentFlag.AlignHCenter)
 
-        self._base_label_text = label_text
+        # Label is "<label_text>\n<value>"; the value part is only re-set
+        # when its 3-decimal text actually changes.
+        self._label_prefix = label_text + "\n"
+        self._last_shown: str | None = None
+        # True while set_value() moves the slider, so _on_slider_changed
+        # ignores the programmatic change.
+        self._suppress = False
 
         self.set_value(default, emit=False)
         self.slider.valueChanged.connect(self._on_slider_changed)
@@ -112,13 +217,11 @@ class ParameterSlider(QtWidgets.QWidget):
     # --------------------------------------------------------------
 
     def _slider_to_value(self, pos: int) -> float:
-        norm = pos / 1000.0
-        return self.min_val + norm * (self.max_val - self.min_val)
+        return self.min_val + pos * self._scale
 
     def _value_to_slider(self, value: float) -> int:
         clamped = max(self.min_val, min(self.max_val, float(value)))
-        norm = (clamped - self.min_val) / (self.max_val - self.min_val)
-        return int(norm * 1000)
+        return round((clamped - self.min_val) * self._inv_range)
 
     # --------------------------------------------------------------
     # public API
@@ -126,46 +229,126 @@ class ParameterSlider(QtWidgets.QWidget):
 
     def set_value(self, value: float, emit: bool = True) -> None:
         slider_pos = self._value_to_slider(value)
-        self.slider.blockSignals(True)
-        self.slider.setValue(slider_pos)
-        self.slider.blockSignals(False)
+        # Same position -> same value and label as now; nothing to update
+        # or emit. (_last_shown is None only for the initial set.)
+        if slider_pos == self.slider.value() and self._last_shown is not None:
+            return
+        self._suppress = True
+        try:
+            self.slider.setValue(slider_pos)
+        finally:
+            self._suppress = False
 
         actual_val = self._slider_to_value(slider_pos)
-        self.label.setText(f"{self._base_label_text}\n{actual_val:.3f}")
+        self._store.values[self._index] = actual_val
+        self._refresh_label()
 
         if emit:
             self.valueChanged.emit(self.param_name, actual_val)
 
     def get_value(self) -> float:
-        return self._slider_to_value(self.slider.value())
+        return self._store.values[self._index]
 
     # --------------------------------------------------------------
     # internal slot
     # --------------------------------------------------------------
 
     def _on_slider_changed(self, pos: int) -> None:
+        if self._suppress:
+            return
         value = self._slider_to_value(pos)
-        self.label.setText(f"{self._base_label_text}\n{value:.3f}")
+        self._store.values[self._index] = value
+        ParameterSlider._dirty.add(self)
         self.valueChanged.emit(self.param_name, value)
 
+    # --------------------------------------------------------------
+    # label refresh
+    # --------------------------------------------------------------
+
+    def _refresh_label(self) -> None:
+        ParameterSlider._dirty.discard(self)
+        text = format(self._store.values[self._index], ".3f")
+        if text == self._last_shown:
+            return
+        self._last_shown = text
+        self.label.setText(self._label_prefix + text)
+
+    @classmethod
+    def refresh_dirty_labels(cls) -> None:
+        """
+        Redraw the value label of every slider moved since the last call.
+        """
+        while cls._dirty:
+            cls._dirty.pop()._refresh_label()
+
 
 class SynthControlWindow(QtWidgets.QWidget):
     """
     Main synth front panel.
     """
 
+    # (label, item data) for the top-row combo boxes
+    POLY_MODE_ITEMS = (("Mono", False), ("Poly", True))
+    LFO_TARGET_ITEMS = (("LFO → Pitch", 0), ("LFO → Filter", 1))
+    NOTE_ITEMS = (
+        ("A2 (110 Hz)", 45),
+        ("A3 (220 Hz)", 57),
+        ("A4 (440 Hz)", 69),
+        ("A1 (55 Hz)", 33),
+    )
+
+    @staticmethod
+    def _fill_combo(combo: QtWidgets.QComboBox, items) -> None:
+        """
+        Fill combo from (label, data) pairs: one addItems() call, then
+        the user data per row.
+        """
+        combo.addItems([label for label, _ in items])
+        for i, (_, data) in enumerate(items):
+            combo.setItemData(i, data)
+
     def __init__(self, sc_controller: SuperColliderSynthController, parent=None):
         super().__init__(parent)
 
         self.sc = sc_controller
 
         self.setWindowTitle("Peppermint Synth - Roth Amplification Ltd")
-        self.setStyleSheet("background-color: white; color: black;")
+        self.setStyleSheet(
+            "* { background-color: white; color: black; }" + SLIDER_STYLESHEET
+        )
 
         self.param_sliders: Dict[str, ParameterSlider] = {}
+        # Values of all sliders, shared by the slider widgets
+        self.param_store = ParameterStore()
 
         self.midi_manager: MidiInputManager | None = None
-        self.preset_manager = SynthPresetManager()
+        # MidiInputManager queues events from the rtmidi thread; this
+        # timer drains them on the GUI thread, so all OSC work stays here.
+        # It only runs while a port is open (_update_midi_drain_timer).
+        self._midi_drain_timer = QtCore.QTimer(self)
+        self._midi_drain_timer.setInterval(2)
+        # Created on first preset save/load (see _get_preset_manager)
+        self.preset_manager: SynthPresetManager | None = None
+        # Created on first use and reused for every preset save/load
+        self._preset_dialog: QtWidgets.QFileDialog | None = None
+
+        # Parameter changes waiting to be sent to SuperCollider. Rapid
+        # slider ticks overwrite each other here (latest value wins) and
+        # go out as a single OSC bundle when the flush timer fires or the
+        # slider is released.
+        self._pending: Dict[str, float] = {}
+        self._flush_timer = QtCore.QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(8)
+        self._flush_timer.timeout.connect(self._flush_params)
+        # Last value queued per parameter, used to drop no-op slider ticks
+        self._last_sent: Dict[str, float] = {}
+
+        # Slider value labels are redrawn at ~30 Hz, not per slider tick.
+        self._label_timer = QtCore.QTimer(self)
+        self._label_timer.setInterval(33)
+        self._label_timer.timeout.connect(ParameterSlider.refresh_dirty_labels)
+        self._label_timer.start()
 
         self._build_ui()
         self._setup_midi()
@@ -187,8 +370,7 @@ class SynthControlWindow(QtWidgets.QWidget):
         mode_lbl.setStyleSheet("color: black;")
 
         self.poly_mode_combo = QtWidgets.QComboBox()
-        self.poly_mode_combo.addItem("Mono", False)
-        self.poly_mode_combo.addItem("Poly", True)
+        self._fill_combo(self.poly_mode_combo, self.POLY_MODE_ITEMS)
         self.poly_mode_combo.currentIndexChanged.connect(
             self._handle_poly_mode_changed
         )
@@ -197,8 +379,7 @@ class SynthControlWindow(QtWidgets.QWidget):
         lfo_lbl.setStyleSheet("color: black;")
 
         self.lfo_target_combo = QtWidgets.QComboBox()
-        self.lfo_target_combo.addItem("LFO → Pitch", 0)
-        self.lfo_target_combo.addItem("LFO → Filter", 1)
+        self._fill_combo(self.lfo_target_combo, self.LFO_TARGET_ITEMS)
         self.lfo_target_combo.currentIndexChanged.connect(
             self._handle_lfo_target_changed
         )
@@ -207,10 +388,8 @@ class SynthControlWindow(QtWidgets.QWidget):
         note_lbl.setStyleSheet("color: black;")
 
         self.note_combo = QtWidgets.QComboBox()
-        self.note_combo.addItem("A2 (110 Hz)", 45)
-        self.note_combo.addItem("A3 (220 Hz)", 57)
-        self.note_combo.addItem("A4 (440 Hz)", 69)
-        self.note_combo.addItem("A1 (55 Hz)", 33)
+        self._fill_combo(self.note_combo, self.NOTE_ITEMS)
+        self.note_combo.currentIndexChanged.connect(self._handle_note_changed)
 
         self.note_on_button = QtWidgets.QPushButton("Note On")
         self.note_off_button = QtWidgets.QPushButton("Note Off")
@@ -258,44 +437,36 @@ class SynthControlWindow(QtWidgets.QWidget):
         main_layout.addLayout(second_layout)
 
         # ---------- Middle: parameter sections (horizontal columns) ----------
-        panel_layout = QtWidgets.QHBoxLayout()
-        panel_layout.setSpacing(30)
-        main_layout.addLayout(panel_layout)
-
-        def create_centered_bank(title: str):
-            """
-            Create a bank (header + centered row of sliders).
-
-            Returns:
-                (bank_layout, sliders_row_layout)
-            """
-            bank_layout = QtWidgets.QVBoxLayout()
-            bank_layout.setSpacing(4)
-
+        # All banks live in one grid: a header row above each row of
+        # sliders, VCO over FILTER in the first column group, and
+        # stretch columns at both ends to keep the panel centred.
+        #
+        #   col: 0 | 1..4        | 5 | 6..7 | 8 | 9..12 | 13 | 14  | 15
+        #   row 0:   VCO           |   LFO    |   ENV     |    AMP
+        #   row 1:   sliders       |   ...
+        #   row 3:   FILTER
+        #   row 4:   sliders
+        panel_grid = QtWidgets.QGridLayout()
+        panel_grid.setHorizontalSpacing(6)  # tight spacing between faders
+        panel_grid.setVerticalSpacing(4)
+        main_layout.addLayout(panel_grid)
+
+        def add_bank(title: str, row: int, col: int, width: int) -> None:
+            """Add a bank header spanning `width` slider columns."""
             header = QtWidgets.QLabel(title)
             header.setAlignment(QtCore.Qt.AlignmentFlag.AlignHCenter)
             header.setStyleSheet("font-weight: bold; color: black;")
-            bank_layout.addWidget(header)
-
-            sliders_row = QtWidgets.QHBoxLayout()
-            sliders_row.setSpacing(6)  # tight spacing between faders
-
-            wrapper = QtWidgets.QHBoxLayout()
-            wrapper.addStretch(1)
-            wrapper.addLayout(sliders_row)
-            wrapper.addStretch(1)
-
-            bank_layout.addLayout(wrapper)
-            return bank_layout, sliders_row
+            panel_grid.addWidget(header, row, col, 1, width)
 
         def add_param_slider(
-            row_layout: QtWidgets.QHBoxLayout,
+            row: int,
+            col: int,
             label_text: str,
             param_name: str,
             min_val: float,
             max_val: float,
             default: float,
-            color: str,
+            bank: str,
         ):
             slider = ParameterSlider(
                 label_text=label_text,
@@ -303,80 +474,80 @@ class SynthControlWindow(QtWidgets.QWidget):
                 min_val=min_val,
                 max_val=max_val,
                 default=default,
-                color=color,
+                bank=bank,
+                store=self.param_store,
+            )
+            # Queued: the handler runs from the event loop rather than
+            # inside the slider's mouse handling, so repaints interleave
+            # with OSC sends. The backend may trail the fader by an event
+            # loop pass, which is fine for a live control; a value that
+            # arrives after the release flush simply rides the next timer.
+            slider.valueChanged.connect(
+                self._handle_param_slider_changed,
+                QtCore.Qt.ConnectionType.QueuedConnection,
             )
-            slider.valueChanged.connect(self._handle_param_slider_changed)
+            # Don't wait for the flush timer once the user lets go
+            slider.slider.sliderReleased.connect(self._flush_params)
             self.param_sliders[param_name] = slider
-            row_layout.addWidget(slider)
-
-        # ----- Column 1: VCO (top) + FILTER (bottom) -----
-        col_vco_filt = QtWidgets.QVBoxLayout()
-        col_vco_filt.setSpacing(12)
-
-        vco_bank, vco_row = create_centered_bank("VCO")
-        add_param_slider(vco_row, "VCO Mix\n(0=VCO1, 1=VCO2)", "vco_mix",
-                         0.0, 1.0, 0.5, "#3f88ff")
-        add_param_slider(vco_row, "VCO1 Wave\n(0=saw, 1=pulse)", "vco1_wave",
-                         0.0, 1.0, 0.0, "#3f88ff")
-        add_param_slider(vco_row, "VCO2 Wave\n(0=saw, 1=pulse)", "vco2_wave",
-                         0.0, 1.0, 0.0, "#3f88ff")
-        add_param_slider(vco_row, "Detune Ratio", "detune",
-                         0.98, 1.08, 1.01, "#3f88ff")
-        col_vco_filt.addLayout(vco_bank)
-
-        filt_bank, filt_row = create_centered_bank("FILTER")
-        add_param_slider(filt_row, "Cutoff (Hz)", "cutoff",
-                         100.0, 8000.0, 1200.0, "#ff8800")
-        add_param_slider(filt_row, "Resonance (0–1)", "res",
-                         0.0, 1.0, 0.2, "#ff8800")
-        add_param_slider(filt_row, "Filter Env Amount", "env_amt",
-                         0.0, 1.0, 0.5, "#ff8800")
-        add_param_slider(filt_row, "Noise Mix (0–1)", "noise_mix",
-                         0.0, 1.0, 0.0, "#ff8800")
-        col_vco_filt.addLayout(filt_bank)
-
-        # ----- Column 2: LFO -----
-        col_lfo = QtWidgets.QVBoxLayout()
-        col_lfo.setSpacing(12)
-
-        lfo_bank, lfo_row = create_centered_bank("LFO")
-        add_param_slider(lfo_row, "LFO Freq (Hz)", "lfo_freq",
-                         0.1, 20.0, 5.0, "#aa44ff")
-        add_param_slider(lfo_row, "LFO Depth (0–1)", "lfo_depth",
-                         0.0, 1.0, 0.0, "#aa44ff")
-        col_lfo.addLayout(lfo_bank)
-
-        # ----- Column 3: ENV (ADSR) -----
-        col_env = QtWidgets.QVBoxLayout()
-        col_env.setSpacing(12)
-
-        env_bank, env_row = create_centered_bank("ENV (ADSR)")
-        add_param_slider(env_row, "Attack (s)", "atk",
-                         0.001, 2.0, 0.01, "#44aa44")
-        add_param_slider(env_row, "Decay (s)", "dec",
-                         0.01, 2.0, 0.1, "#44aa44")
-        add_param_slider(env_row, "Sustain (0–1)", "sus",
-                         0.0, 1.0, 0.7, "#44aa44")
-        add_param_slider(env_row, "Release (s)", "rel",
-                         0.01, 4.0, 0.3, "#44aa44")
-        col_env.addLayout(env_bank)
-
-        # ----- Column 4: AMP -----
-        col_amp = QtWidgets.QVBoxLayout()
-        col_amp.setSpacing(12)
-
-        amp_bank, amp_row = create_centered_bank("AMP")
-        add_param_slider(amp_row, "Level", "amp",
-                         0.0, 0.8, 0.2, "#222222")
-        col_amp.addLayout(amp_bank)
-
-        # Add columns to main panel row with stretch at ends
-        panel_layout.addStretch(1)
-        panel_layout.addLayout(col_vco_filt)
-        panel_layout.addLayout(col_lfo)
-        panel_layout.addLayout(col_env)
-        panel_layout.addLayout(col_amp)
-        panel_layout.addStretch(1)
+            panel_grid.addWidget(slider, row, col)
+
+        # ----- Column group 1: VCO (top) + FILTER (bottom) -----
+        add_bank("VCO", 0, 1, 4)
+        add_param_slider(1, 1, "VCO Mix\n(0=VCO1, 1=VCO2)", "vco_mix",
+                         0.0, 1.0, 0.5, "vco")
+        add_param_slider(1, 2, "VCO1 Wave\n(0=saw, 1=pulse)", "vco1_wave",
+                         0.0, 1.0, 0.0, "vco")
+        add_param_slider(1, 3, "VCO2 Wave\n(0=saw, 1=pulse)", "vco2_wave",
+                         0.0, 1.0, 0.0, "vco")
+        add_param_slider(1, 4, "Detune Ratio", "detune",
+                         0.98, 1.08, 1.01, "vco")
+
+        add_bank("FILTER", 3, 1, 4)
+        add_param_slider(4, 1, "Cutoff (Hz)", "cutoff",
+                         100.0, 8000.0, 1200.0, "filter")
+        add_param_slider(4, 2, "Resonance (0–1)", "res",
+                         0.0, 1.0, 0.2, "filter")
+        add_param_slider(4, 3, "Filter Env Amount", "env_amt",
+                         0.0, 1.0, 0.5, "filter")
+        add_param_slider(4, 4, "Noise Mix (0–1)", "noise_mix",
+                         0.0, 1.0, 0.0, "filter")
+
+        # ----- Column group 2: LFO -----
+        add_bank("LFO", 0, 6, 2)
+        add_param_slider(1, 6, "LFO Freq (Hz)", "lfo_freq",
+                         0.1, 20.0, 5.0, "lfo")
+        add_param_slider(1, 7, "LFO Depth (0–1)", "lfo_depth",
+                         0.0, 1.0, 0.0, "lfo")
+
+        # ----- Column group 3: ENV (ADSR) -----
+        add_bank("ENV (ADSR)", 0, 9, 4)
+        add_param_slider(1, 9, "Attack (s)", "atk",
+                         0.001, 2.0, 0.01, "env")
+        add_param_slider(1, 10, "Decay (s)", "dec",
+                         0.01, 2.0, 0.1, "env")
+        add_param_slider(1, 11, "Sustain (0–1)", "sus",
+                         0.0, 1.0, 0.7, "env")
+        add_param_slider(1, 12, "Release (s)", "rel",
+                         0.01, 4.0, 0.3, "env")
+
+        # ----- Column group 4: AMP -----
+        add_bank("AMP", 0, 14, 1)
+        add_param_slider(1, 14, "Level", "amp",
+                         0.0, 0.8, 0.2, "amp")
+
+        # Gaps between column groups / between VCO and FILTER, and
+        # stretch at the ends to centre everything
+        for gap_col in (5, 8, 13):
+            panel_grid.setColumnMinimumWidth(gap_col, 18)
+        panel_grid.setRowMinimumHeight(2, 8)
+        panel_grid.setColumnStretch(0, 1)
+        panel_grid.setColumnStretch(15, 1)
+
+        # Plain-Python copies of the combo selections, kept current by the
+        # combo handlers so note handlers don't query Qt per keypress.
+        self._poly_mode_cached = bool(self.poly_mode_combo.currentData())
+        self._lfo_target_cached = float(self.lfo_target_combo.currentData())
+        self._current_note_midi = int(self.note_combo.currentData())
 
         # ---------- Bottom: 25-key keyboard ----------
         self.piano_widget = PianoWidget(
@@ -390,30 +561,48 @@ class SynthControlWindow(QtWidgets.QWidget):
     # ------------------------------------------------------------------
 
     def _setup_midi(self) -> None:
+        from midi_input import MidiInputManager
+
         self.midi_manager = MidiInputManager(
-            note_on_cb=self.sc.note_on_midi,
-            note_off_cb=self.sc.note_off_midi,
+            note_on_cb=self._handle_midi_note_on,
+            note_off_cb=self._handle_midi_note_off,
             auto_open_first=True,
         )
+        self._midi_drain_timer.timeout.connect(self.midi_manager.drain)
+        self._update_midi_drain_timer()
         self._populate_midi_ports()
 
+    def _update_midi_drain_timer(self) -> None:
+        """
+        Run the drain timer only while a MIDI port is open, so an idle
+        window doesn't wake every 2 ms. Call after opening/closing ports.
+        """
+        if self.midi_manager is not None and self.midi_manager.current_port_name:
+            if not self._midi_drain_timer.isActive():
+                self._midi_drain_timer.start()
+        else:
+            self._midi_drain_timer.stop()
+
     def _populate_midi_ports(self) -> None:
         if self.midi_manager is None:
             return
 
         ports = self.midi_manager.list_input_ports()
         current_name = self.midi_manager.current_port_name
+        combo = self.midi_port_combo
 
-        self.midi_port_combo.blockSignals(True)
-        self.midi_port_combo.clear()
-        for name in ports:
-            self.midi_port_combo.addItem(name, name)
-
-        if current_name and current_name in ports:
-            idx = ports.index(current_name)
-            self.midi_port_combo.setCurrentIndex(idx)
+        with QtCore.QSignalBlocker(combo):
+            # Same ports as already listed: leave the items alone and only
+            # make sure the selection follows the open port.
+            shown = [combo.itemText(i) for i in range(combo.count())]
+            if shown != ports:
+                combo.clear()
+                combo.addItems(ports)
 
-        self.midi_port_combo.blockSignals(False)
+            if current_name and current_name in ports:
+                idx = ports.index(current_name)
+                if combo.currentIndex() != idx:
+                    combo.setCurrentIndex(idx)
 
     # ------------------------------------------------------------------
     # Event handlers
@@ -421,98 +610,159 @@ class SynthControlWindow(QtWidgets.QWidget):
 
     def _handle_poly_mode_changed(self) -> None:
         is_poly = bool(self.poly_mode_combo.currentData())
+        self._poly_mode_cached = is_poly
         self.sc.set_poly_mode(is_poly)
 
     def _handle_lfo_target_changed(self) -> None:
-        target = int(self.lfo_target_combo.currentData())
-        self.sc.set_param("lfo_target", float(target))
+        self._lfo_target_cached = float(int(self.lfo_target_combo.currentData()))
+        self.sc.set_param("lfo_target", self._lfo_target_cached)
+
+    def _handle_note_changed(self) -> None:
+        self._current_note_midi = int(self.note_combo.currentData())
 
     def _handle_param_slider_changed(self, param_name: str, value: float) -> None:
-        self.sc.set_param(param_name, value)
+        # Sliders move in whole steps, so only an exact repeat is redundant
+        if self._last_sent.get(param_name) == value:
+            return
+        self._last_sent[param_name] = value
+
+        self._pending[param_name] = value
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def _flush_params(self) -> None:
+        """
+        Send all pending parameter changes to SuperCollider in one bundle.
+        """
+        self._flush_timer.stop()
+        if not self._pending:
+            return
+        params, self._pending = self._pending, {}
+        self.sc.set_params_bulk(params)
 
-    def _handle_note_on_button(self) -> None:
-        midi_note = int(self.note_combo.currentData())
-        self.sc.note_on_midi(midi_note, velocity=100)
+    def _voice_params(self) -> Dict[str, float]:
+        """
+        Current panel state (all sliders + LFO target) for new voices.
+        """
+        params = self.param_store.as_dict()
+        params["lfo_target"] = self._lfo_target_cached
+        return params
 
-        for name, slider in self.param_sliders.items():
-            self.sc.set_param(name, slider.get_value())
-        target = int(self.lfo_target_combo.currentData())
-        self.sc.set_param("lfo_target", float(target))
+    def _handle_note_on_button(self) -> None:
+        self.sc.voice_init(self._voice_params())
+        self.sc.note_on_midi(self._current_note_midi, velocity=100)
 
     def _handle_note_off_button(self) -> None:
         self.sc.note_off_all()
 
     def _handle_piano_note_on(self, midi_note: int) -> None:
+        self.sc.voice_init(self._voice_params())
         self.sc.note_on_midi(midi_note, velocity=100)
-        for name, slider in self.param_sliders.items():
-            self.sc.set_param(name, slider.get_value())
-        target = int(self.lfo_target_combo.currentData())
-        self.sc.set_param("lfo_target", float(target))
 
     def _handle_piano_note_off(self, midi_note: int) -> None:
         self.sc.note_off_midi(midi_note)
 
+    def _handle_midi_note_on(self, midi_note: int, velocity: int) -> None:
+        self.sc.voice_init(self._voice_params())
+        self.sc.note_on_midi(midi_note, velocity=velocity)
+
+    def _handle_midi_note_off(self, midi_note: int) -> None:
+        self.sc.note_off_midi(midi_note)
+
     def _handle_midi_refresh(self) -> None:
+        if self.midi_manager is not None:
+            self.midi_manager.invalidate_ports_cache()
         self._populate_midi_ports()
 
     def _handle_midi_port_changed(self) -> None:
         if self.midi_manager is None:
             return
-        port_name = self.midi_port_combo.currentData()
+        port_name = self.midi_port_combo.currentText()
         if port_name:
             self.midi_manager.open_port_by_name(port_name)
+            self._update_midi_drain_timer()
 
     # ------------------------------------------------------------------
     # Preset save/load
     # ------------------------------------------------------------------
 
+    def _get_preset_manager(self) -> SynthPresetManager:
+        if self.preset_manager is None:
+            from preset_manager import SynthPresetManager
+
+            self.preset_manager = SynthPresetManager()
+        return self.preset_manager
+
+    def _run_preset_dialog(self, save: bool) -> str:
+        """
+        Show the preset file dialog and return the chosen path ("" if
+        cancelled).
+
+        Qt's own (non-native) dialog is used and kept on self, so later
+        opens reuse it instead of spinning up the platform shell dialog.
+        """
+        if self._preset_dialog is None:
+            dlg = QtWidgets.QFileDialog(self)
+            dlg.setOption(QtWidgets.QFileDialog.Option.DontUseNativeDialog, True)
+            dlg.setNameFilter("JSON Files (*.json)")
+            self._preset_dialog = dlg
+
+        dlg = self._preset_dialog
+        if save:
+            dlg.setWindowTitle("Save Preset")
+            dlg.setAcceptMode(QtWidgets.QFileDialog.AcceptMode.AcceptSave)
+            dlg.setFileMode(QtWidgets.QFileDialog.FileMode.AnyFile)
+        else:
+            dlg.setWindowTitle("Load Preset")
+            dlg.setAcceptMode(QtWidgets.QFileDialog.AcceptMode.AcceptOpen)
+            dlg.setFileMode(QtWidgets.QFileDialog.FileMode.ExistingFile)
+
+        if dlg.exec() != QtWidgets.QDialog.DialogCode.Accepted:
+            return ""
+        files = dlg.selectedFiles()
+        return files[0] if files else ""
+
     def _handle_save_preset(self) -> None:
-        path, _ = QtWidgets.QFileDialog.getSaveFileName(
-            self,
-            "Save Preset",
-            "",
-            "JSON Files (*.json)",
-        )
+        path = self._run_preset_dialog(save=True)
         if not path:
             return
 
         preset = {
-            "sliders": {},
-            "poly_mode": bool(self.poly_mode_combo.currentData()),
-            "lfo_target": int(self.lfo_target_combo.currentData()),
+            "sliders": self.param_store.as_dict(),
+            "poly_mode": self._poly_mode_cached,
+            "lfo_target": int(self._lfo_target_cached),
             "note_index": int(self.note_combo.currentIndex()),
             "midi_port": self.midi_manager.current_port_name if self.midi_manager else None,
         }
 
-        for name, slider in self.param_sliders.items():
-            preset["sliders"][name] = slider.get_value()
-
         try:
-            self.preset_manager.save_preset_to_file(path, preset)
+            self._get_preset_manager().save_preset_to_file(path, preset)
         except Exception as exc:
             QtWidgets.QMessageBox.critical(self, "Error Saving Preset", str(exc))
 
     def _handle_load_preset(self) -> None:
-        path, _ = QtWidgets.QFileDialog.getOpenFileName(
-            self,
-            "Load Preset",
-            "",
-            "JSON Files (*.json)",
-        )
+        path = self._run_preset_dialog(save=False)
         if not path:
             return
 
         try:
-            preset = self.preset_manager.load_preset_from_file(path)
+            preset = self._get_preset_manager().load_preset_from_file(path)
         except Exception as exc:
             QtWidgets.QMessageBox.critical(self, "Error Loading Preset", str(exc))
             return
 
+        # Combo handlers would each fire their own OSC message; block them
+        # and fold the new state into the single push below instead.
         poly_mode = bool(preset.get("poly_mode", False))
-        self.poly_mode_combo.setCurrentIndex(1 if poly_mode else 0)
-
         lfo_target = int(preset.get("lfo_target", 0))
-        self.lfo_target_combo.setCurrentIndex(0 if lfo_target == 0 else 1)
+        with QtCore.QSignalBlocker(self.poly_mode_combo), QtCore.QSignalBlocker(
+            self.lfo_target_combo
+        ):
+            self.poly_mode_combo.setCurrentIndex(1 if poly_mode else 0)
+            self.lfo_target_combo.setCurrentIndex(0 if lfo_target == 0 else 1)
+        self._poly_mode_cached = poly_mode
+        self._lfo_target_cached = float(self.lfo_target_combo.currentData())
+        self.sc.set_poly_mode(poly_mode)
 
         note_index = int(preset.get("note_index", 0))
         if 0 <= note_index < self.note_combo.count():
@@ -523,6 +773,7 @@ class SynthControlWindow(QtWidgets.QWidget):
             ports = self.midi_manager.list_input_ports()
             if midi_port in ports:
                 self.midi_manager.open_port_by_name(midi_port)
+                self._update_midi_drain_timer()
             self._populate_midi_ports()
 
         for name, value in preset.get("sliders", {}).items():
@@ -531,6 +782,20 @@ class SynthControlWindow(QtWidgets.QWidget):
                 continue
             slider.set_value(float(value), emit=False)
 
-        for name, slider in self.param_sliders.items():
-            self.sc.set_param(name, slider.get_value())
-        self.sc.set_param("lfo_target", float(self.lfo_target_combo.currentData()))
+        # One bundle for active voices; also becomes the start state of new
+        # ones. It supersedes anything still waiting in the coalescing buffer.
+        self._flush_timer.stop()
+        self._pending.clear()
+        self._last_sent.clear()
+        params = self.param_store.as_dict()
+        params["lfo_target"] = self._lfo_target_cached
+        self.sc.set_params_bulk(params)
+
+    def closeEvent(self, event: QtGui.QCloseEvent) -> None:
+        """
+        Stop MIDI delivery and close the input port with the window.
+        """
+        self._midi_drain_timer.stop()
+        if self.midi_manager is not None:
+            self.midi_manager.close()
+        super().closeEvent(event)
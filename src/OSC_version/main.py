@@ -13,18 +13,33 @@ Make sure SuperCollider is running and pyAnalogVoice.scd is loaded:
 Then run:
 
     python main.py
+
+The backend and GUI modules (and with them python-osc / mido) are only
+imported once the QApplication and a splash screen are up, so something
+appears on screen as early as possible.
 """
 
 import sys
-from PyQt6 import QtWidgets
-
-from sc_synth_controller import SuperColliderSynthController
-from gui_main import SynthControlWindow
+from PyQt6 import QtWidgets, QtGui, QtCore
 
 
 def main() -> None:
     app = QtWidgets.QApplication(sys.argv)
 
+    pixmap = QtGui.QPixmap(360, 80)
+    pixmap.fill(QtGui.QColor("white"))
+    splash = QtWidgets.QSplashScreen(pixmap)
+    splash.showMessage(
+        "Loading Peppermint Synth…",
+        QtCore.Qt.AlignmentFlag.AlignCenter,
+        QtGui.QColor("black"),
+    )
+    splash.show()
+    app.processEvents()
+
+    from sc_synth_controller import SuperColliderSynthController
+    from gui_main import SynthControlWindow
+
     sc_controller = SuperColliderSynthController(
         host="127.0.0.1",
         port=57110,
@@ -34,6 +49,7 @@ def main() -> None:
     window = SynthControlWindow(sc_controller)
     window.resize(900, 600)
     window.show()
+    splash.finish(window)
 
     sys.exit(app.exec())
 
@@ -9,12 +9,16 @@ Small helper class that:
 
 - Enumerates available MIDI input ports (via mido + python-rtmidi).
 - Opens one port and listens in a background thread.
-- Forwards note_on / note_off events to user-supplied callbacks.
+- Queues note_on / note_off events from that thread; drain() forwards
+  them to user-supplied callbacks on the caller's (GUI) thread.
 
 Used by the GUI to hook up a hardware or virtual MIDI keyboard.
 """
 
-from typing import Optional, Callable
+import logging
+import time
+from collections import deque
+from typing import Callable, Deque, List, Optional, Tuple
 
 try:
     import mido
@@ -24,6 +28,29 @@ except ImportError:  # pragma: no cover - environment-dependent
     _MIDO_AVAILABLE = False
 
 
+# Diagnostics go through logging (silent unless the application configures
+# a handler) rather than print(), so event delivery never blocks on stdout.
+_log = logging.getLogger("peppermint.osc.midi")
+_log.addHandler(logging.NullHandler())
+
+
+# Port enumeration makes the MIDI backend scan every device, and startup
+# asks for the list several times in a row, so a scan is reused for up
+# to _PORT_SCAN_MAX_AGE seconds: [timestamp, port names].
+_PORT_SCAN_MAX_AGE = 1.0
+_LAST_SCAN: list = [0.0, ()]
+
+
+def _scan_ports() -> List[str]:
+    now = time.monotonic()
+    stamp, names = _LAST_SCAN
+    if stamp and now - stamp < _PORT_SCAN_MAX_AGE:
+        return list(names)
+    names = tuple(mido.get_input_names())
+    _LAST_SCAN[:] = [now, names]
+    return list(names)
+
+
 class MidiInputManager:
     """
     MidiInputManager
@@ -40,8 +67,11 @@ class MidiInputManager:
     The GUI can then:
         - list_input_ports()
         - open_port_by_name("My MIDI Device")
+        - drain() periodically (e.g. from a QTimer)
 
-    while the manager forwards messages to the controller.
+    The rtmidi thread only appends events to a bounded deque (atomic in
+    CPython); drain() pops them and invokes the callbacks, so the
+    callbacks always run on the thread that calls drain().
     """
 
     def __init__(
@@ -57,6 +87,7 @@ class MidiInputManager:
             Called as note_on_cb(note, velocity) when a note-on is received.
         note_off_cb : Callable[[int], None]
             Called as note_off_cb(note) when a note-off is received.
+            Both callbacks are invoked from drain(), not the MIDI thread.
         auto_open_first : bool
             If True, automatically open the first available input port.
         """
@@ -64,6 +95,8 @@ class MidiInputManager:
         self.note_off_cb = note_off_cb
         self._input_port: Optional["mido.ports.BaseInput"] = None
         self.current_port_name: Optional[str] = None
+        # (is_note_on, note, velocity) events waiting for drain()
+        self._queue: Deque[Tuple[bool, int, int]] = deque(maxlen=2048)
 
         if auto_open_first:
             self.open_first_available_port()
@@ -77,15 +110,24 @@ class MidiInputManager:
         """
         Return a list of available MIDI input port names.
 
+        The result of a scan is reused for about a second; call
+        invalidate_ports_cache() first to force a fresh scan.
         Returns empty list if mido is unavailable or an error occurs.
         """
         if not _MIDO_AVAILABLE:
             return []
         try:
-            return mido.get_input_names()
+            return _scan_ports()
         except Exception:
             return []
 
+    @staticmethod
+    def invalidate_ports_cache() -> None:
+        """
+        Forget the last port scan (e.g. when the user asks for a refresh).
+        """
+        _LAST_SCAN[:] = [0.0, ()]
+
     # ------------------------------------------------------------------
     # Port control
     # ------------------------------------------------------------------
@@ -96,7 +138,7 @@ class MidiInputManager:
         """
         ports = self.list_input_ports()
         if not ports:
-            print("[MIDI] No MIDI input ports found or mido unavailable.")
+            _log.info("No MIDI input ports found or mido unavailable.")
             return
         self.open_port_by_name(ports[0])
 
@@ -107,7 +149,7 @@ class MidiInputManager:
         Any previously-open port is closed first.
         """
         if not _MIDO_AVAILABLE:
-            print("[MIDI] mido not available; cannot open MIDI ports.")
+            _log.warning("mido not available; cannot open MIDI ports.")
             return
 
         # Close existing port (if any)
@@ -118,35 +160,76 @@ class MidiInputManager:
                 pass
             self._input_port = None
 
-        print(f"[MIDI] Opening input port: {port_name}")
+        _log.info("Opening input port: %s", port_name)
         self.current_port_name = port_name
 
         def _midi_callback(msg):
             """
             Called in a background thread when a MIDI message arrives.
 
-            We only care about note_on / note_off events.
+            We only care about note_on / note_off events, which are
+            queued for drain(); everything else returns before any other
+            attribute is read.
             """
-            try:
-                if msg.type == "note_on":
-                    note = msg.note
-                    vel = msg.velocity
-                    if vel > 0:
-                        self.note_on_cb(note, vel)
-                    else:
-                        # note_on with velocity 0 => note_off
-                        self.note_off_cb(note)
-                elif msg.type == "note_off":
-                    self.note_off_cb(msg.note)
-            except Exception as exc:
-                print(f"[MIDI] Callback error: {exc}")
+            kind = msg.type
+            if kind == "note_on":
+                vel = msg.velocity
+                # note_on with velocity 0 => note_off
+                self._queue.append((vel > 0, msg.note, vel))
+            elif kind == "note_off":
+                self._queue.append((False, msg.note, 0))
 
         try:
             self._input_port = mido.open_input(port_name, callback=_midi_callback)
         except Exception as exc:
-            print(f"[MIDI] Failed to open MIDI input '{port_name}': {exc}")
+            _log.warning("Failed to open MIDI input '%s': %s", port_name, exc)
             self._input_port = None
             self.current_port_name = None
+            return
+
+        self._ignore_non_note_types(self._input_port)
+
+    @staticmethod
+    def _ignore_non_note_types(port) -> None:
+        """
+        Ask the rtmidi backend to drop sysex, clock and active-sensing
+        messages in C, before they become mido objects. A dense clock
+        stream (24 PPQN) would otherwise dominate the callback.
+
+        Uses mido's private rtmidi handle, so it is best-effort and
+        quietly does nothing on other backends.
+        """
+        rt = getattr(port, "_rt", None)
+        if rt is None:
+            return
+        try:
+            rt.ignore_types(sysex=True, timing=True, active_sense=True)
+        except Exception:
+            pass
+
+    # ------------------------------------------------------------------
+    # Event delivery
+    # ------------------------------------------------------------------
+
+    def drain(self, max_events: int = 64) -> None:
+        """
+        Deliver up to max_events queued note events to the callbacks.
+
+        Call this from the thread that should run the callbacks (the GUI
+        thread); the cap keeps a burst of input from stalling it.
+        """
+        queue = self._queue
+        for _ in range(max_events):
+            if not queue:
+                return
+            is_on, note, vel = queue.popleft()
+            try:
+                if is_on:
+                    self.note_on_cb(note, vel)
+                else:
+                    self.note_off_cb(note)
+            except Exception as exc:
+                _log.exception("Callback error: %s", exc)
 
     def close(self) -> None:
         """
@@ -20,27 +20,41 @@ and it will call:
     note_off_cb(midi_note)
 
 when keys are pressed/released.
+
+Keys are not individual widgets: the whole keyboard is drawn in a single
+paintEvent and mouse clicks are hit-tested against precomputed key
+rectangles.
 """
 
-from typing import Callable, List, Dict
+from bisect import bisect_right
+from typing import Callable, List, Dict, Optional, Set, Tuple
 
-from PyQt6 import QtWidgets, QtCore
+from PyQt6 import QtWidgets, QtCore, QtGui
 
 
 # Pitch-class helpers (0 = C, 1 = C#, ..., 11 = B)
-WHITE_PITCH_CLASSES = {0, 2, 4, 5, 7, 9, 11}
-BLACK_PITCH_CLASSES = {1, 3, 6, 8, 10}
+WHITE_PITCH_CLASSES = frozenset({0, 2, 4, 5, 7, 9, 11})
+BLACK_PITCH_CLASSES = frozenset({1, 3, 6, 8, 10})
+
+# Key colors (idle / pressed) and outlines
+WHITE_KEY_COLOR = QtGui.QColor("#fdfdfd")
+WHITE_KEY_PRESSED_COLOR = QtGui.QColor("#e0e0e0")
+WHITE_KEY_BORDER = QtGui.QColor("#444444")
+BLACK_KEY_COLOR = QtGui.QColor("black")
+BLACK_KEY_PRESSED_COLOR = QtGui.QColor("#444444")
+BLACK_KEY_BORDER = QtGui.QColor("#000000")
 
 
 class PianoWidget(QtWidgets.QWidget):
     """
     25-key piano keyboard (C3–C5, MIDI 48–72).
 
-    - White keys are large buttons spanning the width.
-    - Black keys are narrower buttons drawn on top.
+    - White keys are large rectangles spanning the width.
+    - Black keys are narrower rectangles drawn on top.
 
-    Everything is manually laid out in resizeEvent so the keyboard scales
-    with the window.
+    Key rectangles are recomputed in resizeEvent so the keyboard scales
+    with the window; paintEvent draws them and the mouse handlers map a
+    click position back to a MIDI note.
     """
 
     def __init__(
@@ -76,12 +90,27 @@ class PianoWidget(QtWidgets.QWidget):
 
         self.setMinimumHeight(140)
 
-        # Internal storage for key widgets
-        # white_keys = [{"note": int, "button": QPushButton}, ...]
-        # black_keys = [{"note": int, "left_index": int, "button": QPushButton}, ...]
+        # Key tables
+        # white_keys = [{"note": int}, ...]
+        # black_keys = [{"note": int, "left_index": int}, ...]
         self.white_keys: List[Dict] = []
         self.black_keys: List[Dict] = []
 
+        # Screen geometry, rebuilt by _layout_keys(): [(rect, midi), ...]
+        self._white_rects: List[Tuple[QtCore.QRect, int]] = []
+        self._black_rects: List[Tuple[QtCore.QRect, int]] = []
+
+        # Widget size the rectangles were built for, plus the integer
+        # left edges of every white key (one extra entry for the right
+        # edge of the last key) and of every black key.
+        self._last_size: Tuple[int, int] = (0, 0)
+        self._white_xs: Tuple[int, ...] = ()
+        self._black_xs: Tuple[int, ...] = ()
+
+        # Notes currently held down, and the key grabbed by the mouse
+        self._pressed: Set[int] = set()
+        self._mouse_key: Optional[Tuple[QtCore.QRect, int]] = None
+
         self._create_keys()
 
     # ------------------------------------------------------------------
@@ -90,86 +119,38 @@ class PianoWidget(QtWidgets.QWidget):
 
     def _create_keys(self) -> None:
         """
-        Create all white and black key buttons based on [low_note, high_note].
+        Build the white and black key tables based on [low_note, high_note].
         """
-        # Clean up any old keys (if we ever rebuild)
-        for info in self.white_keys + self.black_keys:
-            info["button"].deleteLater()
         self.white_keys.clear()
         self.black_keys.clear()
+        self._pressed.clear()
+        self._mouse_key = None
 
-        # First pass: create all white keys and remember their order
-        # We'll also remember the last white key index to assign black keys.
+        # Single pass over the range. White keys are numbered in order; each
+        # black key is anchored to the white key just before it.
         last_white_index = -1
-        white_note_to_index: Dict[int, int] = {}
 
-        # We walk through the note range and create buttons on the fly.
         for note in range(self.low_note, self.high_note + 1):
             pitch_class = note % 12
 
             if pitch_class in WHITE_PITCH_CLASSES:
-                # --- white key ---
-                btn = QtWidgets.QPushButton(self)
-                btn.setText("")
-                btn.setFocusPolicy(QtCore.Qt.FocusPolicy.NoFocus)
-                btn.setStyleSheet("""
-                    QPushButton {
-                        background-color: #fdfdfd;
-                        border: 2px solid #444444;
-                        border-radius: 3px;
-                    }
-                    QPushButton:pressed {
-                        background-color: #e0e0e0;
-                    }
-                """)
-                btn.pressed.connect(lambda n=note: self._on_key_pressed(n))
-                btn.released.connect(lambda n=note: self._on_key_released(n))
-
                 last_white_index += 1
-                white_note_to_index[note] = last_white_index
-                self.white_keys.append({"note": note, "button": btn})
-
-        # Second pass: create black keys (using left white-key index)
-        last_white_index = -1
-        for note in range(self.low_note, self.high_note + 1):
-            pitch_class = note % 12
-
-            if pitch_class in WHITE_PITCH_CLASSES:
-                last_white_index = white_note_to_index[note]
-                continue
+                self.white_keys.append({"note": note})
 
-            if pitch_class in BLACK_PITCH_CLASSES:
+            elif pitch_class in BLACK_PITCH_CLASSES and last_white_index >= 0:
                 # This black key sits between the last white key and the next one.
                 # We approximate by anchoring to the left white index.
-                if last_white_index < 0:
-                    continue  # shouldn't happen if low_note is white
-
-                btn = QtWidgets.QPushButton(self)
-                btn.setText("")
-                btn.setFocusPolicy(QtCore.Qt.FocusPolicy.NoFocus)
-                btn.setStyleSheet("""
-                    QPushButton {
-                        background-color: black;
-                        border: 2px solid #000000;
-                        border-radius: 3px;
-                    }
-                    QPushButton:pressed {
-                        background-color: #444444;
-                    }
-                """)
-                btn.pressed.connect(lambda n=note: self._on_key_pressed(n))
-                btn.released.connect(lambda n=note: self._on_key_released(n))
-
                 self.black_keys.append(
                     {
                         "note": note,
                         "left_index": last_white_index,
-                        "button": btn,
                     }
                 )
 
-        # Initial geometry
+        # Initial geometry (force a rebuild for the new key tables)
+        self._last_size = (0, 0)
         self._layout_keys()
+        self.update()
 
     # ------------------------------------------------------------------
     # geometry / layout
@@ -181,14 +162,22 @@ class PianoWidget(QtWidgets.QWidget):
 
     def _layout_keys(self) -> None:
         """
-        Position white and black keys based on current widget size.
-        """
-        if not self.white_keys:
-            return
+        Compute white and black key rectangles for the current widget size.
 
+        Does nothing if the size has not changed since the last call.
+        """
         total_w = self.width()
         total_h = self.height()
 
+        if (total_w, total_h) == self._last_size:
+            return
+        self._last_size = (total_w, total_h)
+
+        self._white_rects = []
+        self._black_rects = []
+        if not self.white_keys:
+            return
+
         top_margin = 10
         bottom_margin = 5
 
@@ -196,31 +185,115 @@ class PianoWidget(QtWidgets.QWidget):
         white_count = len(self.white_keys)
         white_w = total_w / white_count
 
-        # --- layout white keys ---
-        for idx, info in enumerate(self.white_keys):
-            btn = info["button"]
-            x = int(idx * white_w)
-            y = top_margin
-            w = int(white_w)
-            h = int(white_h)
-            btn.setGeometry(x, y, w, h)
-            btn.lower()  # ensure white keys sit underneath
-
-        # --- layout black keys ---
         black_h = int(white_h * 0.6)
         black_w = int(white_w * 0.6)
         black_y = top_margin
 
-        for info in self.black_keys:
-            btn = info["button"]
-            left_idx = info["left_index"]
-
+        # Integer key edges, computed once per size
+        self._white_xs = tuple(int(i * white_w) for i in range(white_count + 1))
+        self._black_xs = tuple(
             # center black key between left white and the next one
-            center_x = (left_idx + 1) * white_w
-            x = int(center_x - black_w / 2)
+            self._white_xs[info["left_index"] + 1] - black_w // 2
+            for info in self.black_keys
+        )
+        white_xs = self._white_xs
+
+        # --- white keys ---
+        for idx, info in enumerate(self.white_keys):
+            x = white_xs[idx]
+            w = white_xs[idx + 1] - x
+            self._white_rects.append(
+                (QtCore.QRect(x, top_margin, w, white_h), info["note"])
+            )
+
+        # --- black keys ---
+        for x, info in zip(self._black_xs, self.black_keys):
+            self._black_rects.append(
+                (QtCore.QRect(x, black_y, black_w, black_h), info["note"])
+            )
+
+    # ------------------------------------------------------------------
+    # painting
+    # ------------------------------------------------------------------
+
+    def paintEvent(self, event) -> None:  # type: ignore[override]
+        painter = QtGui.QPainter(self)
+        painter.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing)
+
+        # White keys first, black keys drawn on top
+        painter.setPen(QtGui.QPen(WHITE_KEY_BORDER, 2))
+        for rect, note in self._white_rects:
+            painter.setBrush(
+                WHITE_KEY_PRESSED_COLOR if note in self._pressed else WHITE_KEY_COLOR
+            )
+            painter.drawRoundedRect(rect, 3, 3)
+
+        painter.setPen(QtGui.QPen(BLACK_KEY_BORDER, 2))
+        for rect, note in self._black_rects:
+            painter.setBrush(
+                BLACK_KEY_PRESSED_COLOR if note in self._pressed else BLACK_KEY_COLOR
+            )
+            painter.drawRoundedRect(rect, 3, 3)
+
+        painter.end()
+
+    # ------------------------------------------------------------------
+    # mouse handling
+    # ------------------------------------------------------------------
+
+    def _key_at(self, pos: QtCore.QPoint) -> Optional[Tuple[QtCore.QRect, int]]:
+        """
+        Return (rect, midi) of the key under pos, or None.
+
+        Black keys sit on top of the white keys, so they are tested first.
+        Key left edges are sorted and non-overlapping within each color,
+        so the only candidate per color is found by bisecting the edge
+        tables instead of scanning every key.
+        """
+        x = pos.x()
+
+        idx = bisect_right(self._black_xs, x) - 1
+        if idx >= 0:
+            entry = self._black_rects[idx]
+            if entry[0].contains(pos):
+                return entry
+
+        idx = bisect_right(self._white_xs, x) - 1
+        if 0 <= idx < len(self._white_rects):
+            entry = self._white_rects[idx]
+            if entry[0].contains(pos):
+                return entry
+        return None
+
+    def mousePressEvent(self, event) -> None:  # type: ignore[override]
+        if event.button() != QtCore.Qt.MouseButton.LeftButton:
+            super().mousePressEvent(event)
+            return
+
+        hit = self._key_at(event.position().toPoint())
+        if hit is None:
+            return
+
+        rect, note = hit
+        self._mouse_key = hit
+        self._pressed.add(note)
+        self.update(rect)
+        self._on_key_pressed(note)
+
+    def mouseReleaseEvent(self, event) -> None:  # type: ignore[override]
+        if event.button() != QtCore.Qt.MouseButton.LeftButton:
+            super().mouseReleaseEvent(event)
+            return
+
+        hit = self._mouse_key
+        if hit is None:
+            return
 
-            btn.setGeometry(x, black_y, black_w, black_h)
-            btn.raise_()  # draw above whites
+        rect, note = hit
+        self._mouse_key = None
+        self._pressed.discard(note)
+        self.update(rect)
+        self._on_key_released(note)
 
     # ------------------------------------------------------------------
     # callbacks
@@ -11,6 +11,11 @@ to/from JSON files.
 The GUI creates a dict describing the current state and hands it to
 SynthPresetManager.save_preset(...). To restore, the GUI calls
 SynthPresetManager.load_preset(...) and applies the result.
+
+If the optional `orjson` package is installed it is used for the
+(de)serialization; otherwise the stdlib `json` module is used. Both
+produce the same human-readable layout (UTF-8, 2-space indent, sorted
+keys), so a re-saved preset diffs cleanly against the original.
 """
 
 from __future__ import annotations
@@ -18,6 +23,13 @@ from __future__ import annotations
 from typing import Any, Dict
 import json
 
+try:
+    import orjson
+    _ORJSON_AVAILABLE = True
+except ImportError:  # pragma: no cover - environment-dependent
+    orjson = None
+    _ORJSON_AVAILABLE = False
+
 
 class SynthPresetManager:
     """
@@ -59,17 +71,39 @@ class SynthPresetManager:
         preset_data : Dict[str, Any]
             Arbitrary dict describing synth state.
         """
+        if _ORJSON_AVAILABLE:
+            with open(path, "wb") as f:
+                f.write(
+                    orjson.dumps(
+                        preset_data,
+                        option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS,
+                    )
+                )
+            return
+
         with open(path, "w", encoding="utf-8") as f:
-            json.dump(preset_data, f, indent=4)
+            # Same layout as the orjson branch above
+            json.dump(preset_data, f, indent=2, sort_keys=True, ensure_ascii=False)
 
     @staticmethod
     def load_preset_from_file(path: str) -> Dict[str, Any]:
         """
         Read a JSON file and return the preset dict.
 
-        Raises whatever exceptions the underlying json/file calls raise;
-        the GUI layer can catch and show a QMessageBox.
+        Raises whatever exceptions the underlying json/file calls raise,
+        or ValueError if the file does not hold a preset object (or its
+        "sliders" entry is not an object); the GUI layer can catch and
+        show a QMessageBox.
         """
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        if _ORJSON_AVAILABLE:
+            with open(path, "rb") as f:
+                data = orjson.loads(f.read())
+        else:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+
+        if not isinstance(data, dict):
+            raise ValueError("Preset file must contain a JSON object")
+        if not isinstance(data.get("sliders", {}), dict):
+            raise ValueError("Preset 'sliders' entry must be a JSON object")
         return data
@@ -19,12 +19,18 @@ The GUI and MIDI layers call its methods:
 - note_off_midi(note: int)
 - note_off_all()
 - set_param(name: str, value: float)
+- set_params_bulk(params: Dict[str, float])
+- voice_init(params: Dict[str, float])
 """
 
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 
 import random
-from pythonosc import udp_client
+from pythonosc import osc_bundle_builder, osc_message_builder, udp_client
+
+
+# Frequency of every MIDI note (A4 = 440 Hz), indexed by note number
+_MIDI_HZ = tuple(440.0 * (2.0 ** ((n - 69) / 12.0)) for n in range(128))
 
 
 def midi_note_to_freq(note: int) -> float:
@@ -37,7 +43,11 @@ def midi_note_to_freq(note: int) -> float:
     where:
         note = 69  => A4 = 440 Hz
         note = 60  => C4 ≈ 261.63 Hz
+
+    In-range notes come from a precomputed table.
     """
+    if 0 <= note < 128:
+        return _MIDI_HZ[note]
     return 440.0 * (2.0 ** ((note - 69) / 12.0))
 
 
@@ -82,6 +92,9 @@ class SuperColliderSynthController:
         # POLY STATE
         self.poly_note_to_node: Dict[int, int] = {}  # MIDI note -> node ID
 
+        # Control values every new voice is started with (see voice_init)
+        self.voice_params: Dict[str, float] = {}
+
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
@@ -95,6 +108,58 @@ class SuperColliderSynthController:
         """
         return random.randint(1000, 9999)
 
+    def _s_new_message(self, node_id: int, freq: float):
+        """
+        Build the /s_new for a new voice, carrying freq plus every value
+        in voice_params so the voice starts with the current panel state.
+        """
+        # /s_new SynthDefName, nodeID, addAction, targetID, paramName, paramValue...
+        args = [
+            "pyAnalogVoice",
+            node_id,
+            0,  # add head of group
+            1,  # default group
+            "freq",
+            float(freq),
+        ]
+        for name, value in self.voice_params.items():
+            args.append(name)
+            args.append(value)
+        return self._build_message("/s_new", args)
+
+    def _active_node_ids(self) -> List[int]:
+        """
+        Return the node IDs of all voices that should receive /n_set.
+        """
+        if not self.poly_mode:
+            return [] if self.mono_node_id is None else [self.mono_node_id]
+        return list(self.poly_note_to_node.values())
+
+    @staticmethod
+    def _build_message(address: str, args: list):
+        """
+        Build a python-osc OscMessage from an address and argument list.
+        """
+        msg = osc_message_builder.OscMessageBuilder(address=address)
+        for arg in args:
+            msg.add_arg(arg)
+        return msg.build()
+
+    def _send_bundle(self, messages: list) -> None:
+        """
+        Send the given OscMessages to scsynth as one immediate OSC bundle
+        (a single UDP packet). A lone message is sent unwrapped.
+        """
+        if not messages:
+            return
+        if len(messages) == 1:
+            self.client.send(messages[0])
+            return
+        bundle = osc_bundle_builder.OscBundleBuilder(osc_bundle_builder.IMMEDIATELY)
+        for msg in messages:
+            bundle.add_content(msg)
+        self.client.send(bundle.build())
+
     # ------------------------------------------------------------------
     # Mode control
     # ------------------------------------------------------------------
@@ -125,6 +190,9 @@ class SuperColliderSynthController:
 
         Behavior
         --------
+        All messages for one note-on (releases + /s_new) are sent as a
+        single OSC bundle.
+
         - Convert note -> frequency.
         - In MONO:
             * kill existing voice (if any),
@@ -139,6 +207,7 @@ class SuperColliderSynthController:
             return
 
         freq = midi_note_to_freq(note)
+        messages = []
 
         if not self.poly_mode:
             # -----------------------
@@ -146,7 +215,9 @@ class SuperColliderSynthController:
             # -----------------------
             if self.mono_node_id is not None:
                 # Release previous mono voice
-                self.client.send_message("/n_set", [self.mono_node_id, "gate", 0.0])
+                messages.append(
+                    self._build_message("/n_set", [self.mono_node_id, "gate", 0.0])
+                )
                 self.mono_node_id = None
                 self.mono_current_note = None
 
@@ -154,18 +225,7 @@ class SuperColliderSynthController:
             self.mono_node_id = node_id
             self.mono_current_note = note
 
-            # /s_new SynthDefName, nodeID, addAction, targetID, paramName, paramValue...
-            self.client.send_message(
-                "/s_new",
-                [
-                    "pyAnalogVoice",
-                    node_id,
-                    0,  # add head of group
-                    1,  # default group
-                    "freq",
-                    float(freq),
-                ],
-            )
+            messages.append(self._s_new_message(node_id, freq))
 
         else:
             # -----------------------
@@ -174,28 +234,20 @@ class SuperColliderSynthController:
             # Retrigger if already active
             old_id = self.poly_note_to_node.pop(note, None)
             if old_id is not None:
-                self.client.send_message("/n_set", [old_id, "gate", 0.0])
+                messages.append(self._build_message("/n_set", [old_id, "gate", 0.0]))
 
             # Steal oldest if at max_voices
             if len(self.poly_note_to_node) >= self.max_voices:
                 oldest_note = next(iter(self.poly_note_to_node.keys()))
                 oldest_id = self.poly_note_to_node.pop(oldest_note)
-                self.client.send_message("/n_set", [oldest_id, "gate", 0.0])
+                messages.append(self._build_message("/n_set", [oldest_id, "gate", 0.0]))
 
             node_id = self._generate_node_id()
             self.poly_note_to_node[note] = node_id
 
-            self.client.send_message(
-                "/s_new",
-                [
-                    "pyAnalogVoice",
-                    node_id,
-                    0,
-                    1,
-                    "freq",
-                    float(freq),
-                ],
-            )
+            messages.append(self._s_new_message(node_id, freq))
+
+        self._send_bundle(messages)
 
     def note_off_midi(self, note: int) -> None:
         """
@@ -243,6 +295,7 @@ class SuperColliderSynthController:
         while tweaking GUI sliders with no notes held).
         """
         value = float(value)
+        self.voice_params[name] = value
 
         if not self.poly_mode:
             if self.mono_node_id is None:
@@ -253,3 +306,44 @@ class SuperColliderSynthController:
                 return
             for node_id in self.poly_note_to_node.values():
                 self.client.send_message("/n_set", [node_id, name, value])
+
+    def set_params_bulk(self, params: Dict[str, float]) -> None:
+        """
+        Set several SynthDef parameters on all active voices at once.
+
+        Each active node gets a single /n_set carrying every name/value
+        pair, and all of those messages go out in one OSC bundle, so a
+        batch of slider changes costs one UDP packet instead of one per
+        parameter per voice.
+        """
+        if not params:
+            return
+
+        for name, value in params.items():
+            self.voice_params[name] = float(value)
+
+        node_ids = self._active_node_ids()
+        if not node_ids:
+            return
+
+        pairs = []
+        for name, value in params.items():
+            pairs.append(name)
+            pairs.append(float(value))
+
+        self._send_bundle(
+            [self._build_message("/n_set", [node_id] + pairs) for node_id in node_ids]
+        )
+
+    def voice_init(self, params: Dict[str, float]) -> None:
+        """
+        Set the controls that newly started voices are created with.
+
+        The values are passed as name/value pairs on the /s_new of every
+        following note-on, so a new voice starts with the whole panel
+        state in one message instead of a /n_set per parameter after it
+        has already begun sounding. Active voices are not touched; use
+        set_params_bulk() for those.
+        """
+        for name, value in params.items():
+            self.voice_params[name] = float(value)
@@ -6,19 +6,59 @@ peppermint_audio_devices.py
 Helper functions for enumerating audio output devices on Linux for
 use with SuperCollider / scsynth via ALSA "hw:card,device" names.
 
-This does **not** talk to SuperCollider directly; it shells out to
-`aplay -l` (ALSA) and parses the card / device list, building
+This does **not** talk to SuperCollider directly; it reads the ALSA
+card / PCM list from /proc/asound (falling back to parsing `aplay -l`
+where /proc/asound is missing or lists no playback PCMs), building
 device strings like "hw:0,0", "hw:1,0", etc.
 
-On non-ALSA systems (or where `aplay` is missing) this will simply
-return an empty list.
+On non-ALSA systems (or where neither source is available) this will
+simply return an empty list.
 """
 
 from __future__ import annotations
 
+import glob
+import os
 import re
 import subprocess
-from typing import List, Tuple
+from typing import Dict, List, Tuple
+
+
+_ASOUND_DIR = "/proc/asound"
+
+# Lines of /proc/asound/cards look like:
+#    0 [PCH            ]: HDA-Intel - HDA Intel PCH
+_PROC_CARD_RE = re.compile(
+    r"^\s*(?P<card>\d+)\s+\[(?P<card_id>[^\]]*)\]:.*?\s-\s(?P<card_name>.+)$",
+    re.MULTILINE,
+)
+
+# Playback PCM directories: /proc/asound/card<N>/pcm<M>p
+_PCM_DIR_RE = re.compile(r"card(?P<card>\d+)/pcm(?P<dev>\d+)p$")
+
+
+# Example lines from `aplay -l`:
+#   card 0: PCH [HDA Intel PCH], device 0: ALC298 Analog [ALC298 Analog]
+_CARD_RE = re.compile(
+    r"card\s+(?P<card>\d+):\s+(?P<card_id>[^\s]+)\s+\[(?P<card_name>[^\]]+)\],\s*"
+    r"device\s+(?P<dev>\d+):\s+(?P<dev_id>[^\s]+)\s+\[(?P<dev_name>[^\]]+)\]"
+)
+
+
+def _format_device(
+    card_index: str, card_name: str, dev_index: str, dev_id: str, dev_name: str
+) -> Tuple[str, str]:
+    device_name = f"hw:{card_index},{dev_index}"
+    description = f"card {card_index} ({card_name}) dev {dev_index} ({dev_id} / {dev_name})"
+    return device_name, description
+
+
+def _read_text(path: str) -> str:
+    try:
+        with open(path, "r", encoding="utf-8", errors="replace") as f:
+            return f.read()
+    except OSError:
+        return ""
 
 
 def list_alsa_devices() -> List[Tuple[str, str]]:
@@ -27,8 +67,56 @@ def list_alsa_devices() -> List[Tuple[str, str]]:
     playback devices, where `device_name` is suitable to pass to
     SuperCollider's ServerOptions.device on Linux, e.g. "hw:0,0".
 
-    If `aplay -l` is unavailable or parsing fails, returns an empty list.
+    Reads /proc/asound when present (no subprocess); if that is missing
+    or lists no playback PCMs, falls back to `aplay -l`. If neither
+    works, returns an empty list.
     """
+    if os.path.isdir(_ASOUND_DIR):
+        devices = _list_proc_asound_devices()
+        if devices:
+            return devices
+    return _list_aplay_devices()
+
+
+def _list_proc_asound_devices() -> List[Tuple[str, str]]:
+    """Playback devices from /proc/asound/cards and card*/pcm*p/info."""
+    card_names: Dict[str, str] = {
+        m.group("card"): m.group("card_name").strip()
+        for m in _PROC_CARD_RE.finditer(_read_text(os.path.join(_ASOUND_DIR, "cards")))
+    }
+
+    found: List[Tuple[int, int, Tuple[str, str]]] = []
+    for pcm_dir in glob.glob(os.path.join(_ASOUND_DIR, "card*", "pcm*p")):
+        m = _PCM_DIR_RE.search(pcm_dir.replace(os.sep, "/"))
+        if not m:
+            continue
+        card_index, dev_index = m.group("card"), m.group("dev")
+
+        # info is "key: value" lines (card, device, id, name, ...)
+        info: Dict[str, str] = {}
+        for line in _read_text(os.path.join(pcm_dir, "info")).splitlines():
+            key, sep, value = line.partition(":")
+            if sep:
+                info[key.strip()] = value.strip()
+        dev_id = info.get("id", "")
+        dev_name = info.get("name", dev_id)
+        card_name = card_names.get(card_index, f"card{card_index}")
+
+        found.append(
+            (
+                int(card_index),
+                int(dev_index),
+                _format_device(card_index, card_name, dev_index, dev_id, dev_name),
+            )
+        )
+
+    # Same card/device order as `aplay -l`
+    found.sort(key=lambda item: (item[0], item[1]))
+    return [device for _, _, device in found]
+
+
+def _list_aplay_devices() -> List[Tuple[str, str]]:
+    """Playback devices parsed from `aplay -l` output."""
     try:
         proc = subprocess.run(
             ["aplay", "-l"],
@@ -42,26 +130,13 @@ def list_alsa_devices() -> List[Tuple[str, str]]:
     text = proc.stdout or ""
     devices: List[Tuple[str, str]] = []
 
-    # Example lines from `aplay -l`:
-    #   card 0: PCH [HDA Intel PCH], device 0: ALC298 Analog [ALC298 Analog]
-    card_re = re.compile(
-        r"card\s+(?P<card>\d+):\s+(?P<card_id>[^\s]+)\s+\[(?P<card_name>[^\]]+)\],\s*"
-        r"device\s+(?P<dev>\d+):\s+(?P<dev_id>[^\s]+)\s+\[(?P<dev_name>[^\]]+)\]"
-    )
-
-    for line in text.splitlines():
-        m = card_re.search(line)
-        if not m:
-            continue
-
+    for m in _CARD_RE.finditer(text):
         card_index = m.group("card")
         dev_index = m.group("dev")
         card_name = m.group("card_name").strip()
         dev_name = m.group("dev_name").strip()
         dev_id = m.group("dev_id").strip()
 
-        device_name = f"hw:{card_index},{dev_index}"
-        description = f"card {card_index} ({card_name}) dev {dev_index} ({dev_id} / {dev_name})"
-        devices.append((device_name, description))
+        devices.append(_format_device(card_index, card_name, dev_index, dev_id, dev_name))
 
     return devices
@@ -12,21 +12,78 @@ Supriya-based threaded synth engine for "Peppermint Synth - Roth Amplification L
   * NO .linlin(); use simple arithmetic where needed
 - Provides:
   * Mono and poly modes (toggle from GUI)
-  * Threaded command queue so GUI never blocks audio thread
+  * Lock-free command queue so GUI/MIDI threads never block the audio thread
+    (parameter changes are merged into a snapshot under a brief lock)
   * 'Reboot SC' hook so the GUI can restart the SC server
+  * One scsynth per process, shared by all engine instances
 """
 
 from __future__ import annotations
 
-import queue
+import atexit
+import os
+import sys
 import threading
-from typing import Dict, Optional
+from collections import deque
+from typing import Deque, Dict, Optional
 
 import supriya
 from supriya import Envelope, synthdef
+from supriya.enums import BootStatus
+from supriya.exceptions import ServerCannotBoot, ServerOffline, TooManyClients
+from supriya.osc import OscMessage
 from supriya.ugens import EnvGen, Out, Pulse, RLPF, Saw, SinOsc, WhiteNoise
 
 
+# 440 Hz equal-tempered frequency of every MIDI note, indexed by note
+_MIDI_HZ = tuple(440.0 * (2.0 ** ((n - 69) / 12.0)) for n in range(128))
+
+# MIDI velocity 0..127 normalised to 0.0..1.0, indexed by velocity
+_VEL_NORM = tuple(v / 127.0 for v in range(128))
+
+# Real-time priority requested for the engine thread (Linux SCHED_FIFO).
+# Kept below typical JACK / PipeWire audio threads (70+).
+_ENGINE_RT_PRIORITY = 20
+
+# Command kinds for the engine's command queue (dispatch table keys).
+# Producers and the worker share these exact, interned objects.
+_CMD_SET_POLY_MODE = sys.intern("set_poly_mode")
+_CMD_NOTE_ON = sys.intern("note_on")
+_CMD_NOTE_OFF = sys.intern("note_off")
+_CMD_NOTE_OFF_ALL = sys.intern("note_off_all")
+_CMD_REBOOT_SERVER = sys.intern("reboot_server")
+_CMD_SHUTDOWN = sys.intern("shutdown")
+
+# Smallest change worth sending to the server, per parameter. Most
+# controls are 0..1 or seconds; wide-range ones get coarser steps.
+_DEFAULT_PARAM_EPS = 1e-6
+_PARAM_EPS: Dict[str, float] = {
+    "cutoff": 1e-2,
+    "lfo_freq": 1e-4,
+}
+
+# Initial values of the global (per-engine) voice parameters; also the
+# set of names set_param() accepts.
+_DEFAULT_VOICE_PARAMS: Dict[str, float] = {
+    "vco_mix": 0.5,
+    "vco1_wave": 0.0,
+    "vco2_wave": 0.0,
+    "detune": 1.01,
+    "cutoff": 1200.0,
+    "res": 0.2,
+    "env_amt": 0.5,
+    "noise_mix": 0.0,
+    "lfo_freq": 5.0,
+    "lfo_depth": 0.0,
+    "lfo_target": 0.0,
+    "atk": 0.01,
+    "dec": 0.1,
+    "sus": 0.7,
+    "rel": 0.3,
+    "amp": 0.2,
+}
+
+
 # ------------------------------------------------------------------
 # SynthDef
 # ------------------------------------------------------------------
@@ -81,24 +138,19 @@ def peppermint_voice(
         gate=gate,
         # IMPORTANT:
         # Use done_action=0 so the synth node is NOT auto-freed when
-        # the envelope finishes. The engine will:
-        #   - In poly mode: gate=0 and forget the voice (no further .set),
-        #   - In mono mode: reuse the same node for new notes.
-        # This prevents '/n_set Node XXX not found' spam when you later
-        # tweak parameters on voices SC already killed.
+        # the envelope finishes. Every node is reused: a note is just
+        # gate=1 / gate=0 on it, with no /s_new or /n_free per note.
+        #   - In poly mode: a fixed pool of voices, allocated at boot,
+        #   - In mono mode: the same node for every note.
+        # Oscillator/LFO phase free-runs between notes; the envelope
+        # restarts on each new gate edge.
         done_action=0,
     )
 
     # --- Filter envelope (full sustain; amount set by env_amt) ---
-    filt_env = EnvGen.kr(
-        envelope=Envelope.adsr(
-            attack_time=atk,
-            decay_time=dec,
-            sustain=1.0,         # always full; scaled by env_amt downstream
-            release_time=rel,
-        ),
-        gate=gate,
-    )
+    # Same A/D/R as the amp envelope, so rather than a second EnvGen it is
+    # the amp envelope rescaled to hold at 1.0 through the sustain stage.
+    filt_env = (amp_env / sus.clip(0.0001, 1.0)).clip(0.0, 1.0)
 
     # --- LFO (control-rate) ---
     raw_lfo = SinOsc.kr(frequency=lfo_freq)
@@ -109,29 +161,25 @@ def peppermint_voice(
     lfo_filter = lfo_target * lfo
 
     # Pitch modulation: up to +/- 6 semitones at full LFO depth
-    pitch_semitones = lfo_pitch * 6.0
-    pitch_factor = 2.0 ** (pitch_semitones / 12.0)
-
-    # Wave-shape mix for each oscillator (0=saw,1=pulse mapped to -1..+1)
-    v1_mix = (vco1_wave * 2.0) - 1.0
-    v2_mix = (vco2_wave * 2.0) - 1.0
+    # (2 ** (semitones / 12) with semitones = lfo_pitch * 6, folded)
+    pitch_factor = 2.0 ** (lfo_pitch * 0.5)
 
     # Apply pitch LFO and detune
     freq1 = frequency * pitch_factor
     freq2 = frequency * detune * pitch_factor
 
-    # VCO1: saw + pulse blend
+    # Each VCO blends saw -> pulse by its wave control (0=saw, 1=pulse).
+    # Written as a lerp so it costs one subtract, multiply and add.
     vco1_saw = Saw.ar(frequency=freq1)
     vco1_pulse = Pulse.ar(frequency=freq1, width=0.5)
-    vco1 = ((1.0 - v1_mix) * 0.5 * vco1_saw) + ((1.0 + v1_mix) * 0.5 * vco1_pulse)
+    vco1 = vco1_saw + ((vco1_pulse - vco1_saw) * vco1_wave)
 
-    # VCO2: saw + pulse blend
     vco2_saw = Saw.ar(frequency=freq2)
     vco2_pulse = Pulse.ar(frequency=freq2, width=0.5)
-    vco2 = ((1.0 - v2_mix) * 0.5 * vco2_saw) + ((1.0 + v2_mix) * 0.5 * vco2_pulse)
+    vco2 = vco2_saw + ((vco2_pulse - vco2_saw) * vco2_wave)
 
     # Crossfade VCO1 <-> VCO2
-    osc_mix = ((1.0 - vco_mix) * vco1) + (vco_mix * vco2)
+    osc_mix = vco1 + ((vco2 - vco1) * vco_mix)
 
     # White noise
     noise = WhiteNoise.ar() * noise_mix * 0.3
@@ -157,11 +205,52 @@ def peppermint_voice(
         reciprocal_of_q=rq,
     )
 
-    # Final output
-    sig = sig * amp_env * amp
+    # Final output (envelope and level combined at control rate first)
+    sig = sig * (amp_env * amp)
     Out.ar(bus=0, source=[sig, sig])
 
 
+# Compiled once; each (re)boot sends these bytes in a /d_recv instead of
+# having add_synthdefs() serialise the graph again.
+_VOICE_SYNTHDEF_BYTES = peppermint_voice.compile()
+
+
+# ------------------------------------------------------------------
+# Process-wide SuperCollider server
+# ------------------------------------------------------------------
+
+# Booting scsynth takes seconds, so one server is shared by every engine
+# in the process: a new engine reuses it while it is online. It is quit
+# by an explicit reboot_server() (which boots a fresh one) or at
+# interpreter exit.
+_shared_server: Optional[supriya.Server] = None
+_shared_server_lock = threading.Lock()
+
+
+def _get_shared_server() -> supriya.Server:
+    """Return the shared server, booting a new one if it is not online."""
+    global _shared_server
+    with _shared_server_lock:
+        if _shared_server is None or _shared_server.boot_status != BootStatus.ONLINE:
+            _shared_server = supriya.Server().boot()
+        return _shared_server
+
+
+def _quit_shared_server() -> None:
+    """Quit the shared server, if any; the next get boots a fresh one."""
+    global _shared_server
+    with _shared_server_lock:
+        server, _shared_server = _shared_server, None
+    if server is not None:
+        try:
+            server.quit()
+        except ServerOffline:
+            pass
+
+
+atexit.register(_quit_shared_server)
+
+
 # ------------------------------------------------------------------
 # Threaded Supriya engine with mono/poly modes and reboot support
 # ------------------------------------------------------------------
@@ -173,6 +262,7 @@ class PeppermintSynthEngine:
     Public API (GUI thread safe):
         - set_poly_mode(is_poly: bool)
         - set_param(name: str, value: float)
+        - set_params_bulk(params: Dict[str, float])
         - note_on(midi_note: int, velocity: int)
         - note_off(midi_note: int)
         - note_off_all()
@@ -181,9 +271,21 @@ class PeppermintSynthEngine:
         - is_server_running() -> bool
     """
 
+    # Size of the poly voice pool (voices stolen oldest-first beyond this)
+    POLY_VOICES = 16
+
     def __init__(self) -> None:
-        # Queue of commands from GUI thread -> audio thread
-        self._command_queue: "queue.Queue" = queue.Queue()
+        # Commands from GUI / MIDI threads -> audio thread. There are
+        # several producers, so rather than an index-based SPSC ring this
+        # is a deque: append()/popleft() are atomic in CPython, so neither
+        # side takes a lock. The event only wakes the worker.
+        self._commands: Deque[tuple] = deque()
+        self._wakeup = threading.Event()
+        # Parameter changes skip the queue: producers merge them into this
+        # latest-value snapshot, which the worker swaps out whole. The
+        # lock only covers the merge/swap, never any server I/O.
+        self._pending_params: Dict[str, float] = {}
+        self._params_lock = threading.Lock()
 
         # Supriya state (only touched on audio thread)
         self._server: Optional[supriya.Server] = None
@@ -194,7 +296,21 @@ class PeppermintSynthEngine:
 
         # Voice / parameter state
         self._poly_mode: bool = False
-        self._global_params: Dict[str, float] = {}
+        # Filled with the defaults up front so changes made before (or
+        # between) server boots are kept and applied to the next pool.
+        self._global_params: Dict[str, float] = dict(_DEFAULT_VOICE_PARAMS)
+        # Control template for new synths: _global_params plus per-note
+        # keys, mutated in place and refreshed only when params change.
+        self._controls: Dict[str, float] = {}
+        self._controls_dirty: bool = True
+        # Poly voices are a fixed pool of synths created at boot and kept
+        # alive at gate=0 (the SynthDef never frees itself). Sounding
+        # voices live in _poly_voices (note -> voice, oldest first); idle
+        # ones wait in _free_voices, longest-released first. Every voice
+        # referenced here is a live node until the group is freed, so
+        # .set() on it needs no guard.
+        self._voice_pool: list[supriya.synths.Synth] = []
+        self._free_voices: Deque[supriya.synths.Synth] = deque()
         self._poly_voices: Dict[int, supriya.synths.Synth] = {}
         self._mono_voice: Optional[supriya.synths.Synth] = None
 
@@ -208,29 +324,42 @@ class PeppermintSynthEngine:
 
     # --------------- Public API (GUI side) ---------------
 
+    def _push(self, cmd: tuple) -> None:
+        self._commands.append(cmd)
+        self._wakeup.set()
+
     def set_poly_mode(self, is_poly: bool) -> None:
-        self._command_queue.put(("set_poly_mode", bool(is_poly)))
+        self._push((_CMD_SET_POLY_MODE, bool(is_poly)))
 
     def set_param(self, name: str, value: float) -> None:
-        self._command_queue.put(("set_param", str(name), float(value)))
+        with self._params_lock:
+            self._pending_params[str(name)] = float(value)
+        self._wakeup.set()
+
+    def set_params_bulk(self, params: Dict[str, float]) -> None:
+        """Queue several parameter changes at once."""
+        updates = {str(k): float(v) for k, v in params.items()}
+        with self._params_lock:
+            self._pending_params.update(updates)
+        self._wakeup.set()
 
     def note_on(self, midi_note: int, velocity: int = 100) -> None:
-        self._command_queue.put(("note_on", int(midi_note), int(velocity)))
+        self._push((_CMD_NOTE_ON, int(midi_note), int(velocity)))
 
     def note_off(self, midi_note: int) -> None:
-        self._command_queue.put(("note_off", int(midi_note)))
+        self._push((_CMD_NOTE_OFF, int(midi_note)))
 
     def note_off_all(self) -> None:
-        self._command_queue.put(("note_off_all",))
+        self._push((_CMD_NOTE_OFF_ALL,))
 
     def reboot_server(self) -> None:
         """Request a SuperCollider server reboot from the GUI thread."""
-        self._command_queue.put(("reboot_server",))
+        self._push((_CMD_REBOOT_SERVER,))
 
     def shutdown(self) -> None:
         """Request engine shutdown and stop the audio thread."""
         self._running = False
-        self._command_queue.put(("shutdown",))
+        self._push((_CMD_SHUTDOWN,))
 
     def is_server_running(self) -> bool:
         """Return True while the Supriya server is booted and running."""
@@ -238,48 +367,85 @@ class PeppermintSynthEngine:
 
     # --------------- Helpers ---------------
 
+    @staticmethod
+    def _raise_thread_priority() -> None:
+        """Put the calling thread under SCHED_FIFO, if the OS allows it.
+
+        Needs an rtprio limit (e.g. the 'audio' group on most distros);
+        otherwise, or off Linux, the thread keeps its default policy.
+        RESET_ON_FORK stops scsynth, started from this thread, from
+        inheriting the policy.
+        """
+        if not hasattr(os, "sched_setscheduler"):
+            return
+        policy = os.SCHED_FIFO | getattr(os, "SCHED_RESET_ON_FORK", 0)
+        try:
+            os.sched_setscheduler(0, policy, os.sched_param(_ENGINE_RT_PRIORITY))
+        except OSError:
+            pass
+
     @staticmethod
     def _midi_to_hz(midi_note: int) -> float:
-        """Standard 440 Hz concert pitch conversion."""
+        """Standard 440 Hz concert pitch conversion (table lookup)."""
+        if 0 <= midi_note < 128:
+            return _MIDI_HZ[midi_note]
         return 440.0 * (2.0 ** ((midi_note - 69) / 12.0))
 
+    def _voice_controls(self, **per_note: float) -> Dict[str, float]:
+        """Global params with per_note overrides, for add_synth(**controls).
+
+        The returned dict is reused; callers must not hold on to it.
+        """
+        controls = self._controls
+        if self._controls_dirty:
+            controls.clear()
+            controls.update(self._global_params)
+            self._controls_dirty = False
+        controls.update(per_note)
+        return controls
+
     # --------------- Worker thread entry ---------------
 
     def _thread_main(self) -> None:
         """Boot server, install SynthDef, then process commands until shutdown."""
+        self._raise_thread_priority()
         server: Optional[supriya.Server] = None
 
-        def _boot_server() -> None:
+        def _boot_server(restart: bool = False) -> None:
             """(Re)boot the SuperCollider server and install SynthDefs.
 
+            This engine's group and voices are torn down first. With
+            restart=True the shared scsynth is quit and a fresh one
+            booted; otherwise a server that is already online is reused.
+
             If booting fails (e.g. UDP port already in use), this logs
             the error and leaves _server_running=False so the GUI can
             reflect that state and the user can retry.
             """
             nonlocal server
 
-            # Tear down any existing server/group
+            # Tear down this engine's group (and with it all its voices)
             if self._synth_group is not None:
                 try:
                     self._synth_group.free()
-                except Exception:
+                except ServerOffline:
                     pass
                 self._synth_group = None
 
-            if self._server is not None:
-                try:
-                    self._server.quit()
-                except Exception:
-                    pass
-                self._server = None
+            if restart:
+                _quit_shared_server()
 
+            self._server = None
             self._server_running = False
+            self._voice_pool.clear()
+            self._free_voices.clear()
             self._poly_voices.clear()
             self._mono_voice = None
 
             try:
-                server = supriya.Server().boot()
-            except Exception as exc:
+                server = _get_shared_server()
+            except (ServerCannotBoot, TooManyClients, RuntimeError, OSError) as exc:
+                # RuntimeError: scsynth not found / no notification reply
                 print(f"[Peppermint] Failed to boot SuperCollider server: {exc}")
                 self._server = None
                 self._server_running = False
@@ -289,106 +455,130 @@ class PeppermintSynthEngine:
             self._server_running = True
 
             # Install SynthDef and sync
-            server.add_synthdefs(peppermint_voice)
+            server.send(OscMessage("/d_recv", _VOICE_SYNTHDEF_BYTES))
             server.sync()
 
             # Group that contains all voices
             self._synth_group = server.add_group()
 
-            # Initialize global params only once (GUI changes survive reboots)
-            if not self._global_params:
-                self._global_params = {
-                    "vco_mix": 0.5,
-                    "vco1_wave": 0.0,
-                    "vco2_wave": 0.0,
-                    "detune": 1.01,
-                    "cutoff": 1200.0,
-                    "res": 0.2,
-                    "env_amt": 0.5,
-                    "noise_mix": 0.0,
-                    "lfo_freq": 5.0,
-                    "lfo_depth": 0.0,
-                    "lfo_target": 0.0,
-                    "atk": 0.01,
-                    "dec": 0.1,
-                    "sus": 0.7,
-                    "rel": 0.3,
-                    "amp": 0.2,
-                }
+            # Pre-allocate the silent poly voice pool in one bundle
+            idle = self._voice_controls(gate=0.0, amp=0.0)
+            with server.at():
+                self._voice_pool = [
+                    self._synth_group.add_synth(synthdef=peppermint_voice, **idle)
+                    for _ in range(self.POLY_VOICES)
+                ]
+            self._free_voices.extend(self._voice_pool)
 
         # Initial boot when the engine thread starts
         _boot_server()
 
+        def _shutdown(cmd: tuple) -> None:
+            self._running = False
+
+        # kind -> handler(cmd) for every queued command
+        dispatch = {
+            _CMD_SHUTDOWN: _shutdown,
+            _CMD_REBOOT_SERVER: lambda cmd: _boot_server(restart=True),
+            _CMD_SET_POLY_MODE: lambda cmd: self._handle_set_poly_mode(cmd[1]),
+            _CMD_NOTE_ON: lambda cmd: self._handle_note_on(cmd[1], cmd[2]),
+            _CMD_NOTE_OFF: lambda cmd: self._handle_note_off(cmd[1]),
+            _CMD_NOTE_OFF_ALL: lambda cmd: self._handle_note_off_all(),
+        }
+
         # Main command loop
+        commands = self._commands
+        wakeup = self._wakeup
         while self._running:
+            # Sleep until a command arrives (shutdown() pushes one too),
+            # rather than waking on a timeout to poll an empty queue.
+            wakeup.wait()
+            # Clear before draining: anything pushed after this point
+            # sets the event again, so nothing is left waiting.
+            wakeup.clear()
+
             try:
-                cmd = self._command_queue.get(timeout=0.1)
-            except queue.Empty:
-                continue
-
-            if not cmd:
-                continue
-
-            kind = cmd[0]
-
-            if kind == "shutdown":
-                break
-            elif kind == "reboot_server":
-                _boot_server()
-            elif kind == "set_poly_mode":
-                self._poly_mode = bool(cmd[1])
-            elif kind == "set_param":
-                name, value = cmd[1], cmd[2]
-                self._handle_set_param(name, value)
-            elif kind == "note_on":
-                midi_note, velocity = cmd[1], cmd[2]
-                self._handle_note_on(midi_note, velocity)
-            elif kind == "note_off":
-                midi_note = cmd[1]
-                self._handle_note_off(midi_note)
-            elif kind == "note_off_all":
-                self._handle_note_off_all()
+                # Pending parameters (last value per name) are applied
+                # before each queued command, so a change made before a
+                # note_on is heard on that note, and once more after the
+                # backlog. A knob drag costs one .set() per voice per
+                # wakeup, however many values the GUI sent.
+                self._apply_pending_params()
+                while commands:
+                    cmd = commands.popleft()
+                    self._apply_pending_params()
+
+                    handler = dispatch.get(cmd[0])
+                    if handler is not None:
+                        handler(cmd)
+                        if not self._running:
+                            break
+                self._apply_pending_params()
+            except ServerOffline:
+                # scsynth went away underneath us (crash, killed). Stop
+                # talking to it; the GUI shows it down and can reboot.
+                print("[Peppermint] SuperCollider server went offline.")
+                self._server_running = False
 
         # Cleanup on exit
-        self._handle_note_off_all()
+        if self._server_running:
+            self._handle_note_off_all()
 
         if self._synth_group is not None:
             try:
                 self._synth_group.free()
-            except Exception:
+            except ServerOffline:
                 pass
             self._synth_group = None
 
-        if self._server is not None:
-            try:
-                self._server.quit()
-            except Exception:
-                pass
-            self._server = None
-
+        # The shared server stays up for the next engine; it is quit at
+        # interpreter exit.
+        self._server = None
         self._server_running = False
 
     # --------------- Internal handlers (audio thread only) ---------------
 
-    def _handle_set_param(self, name: str, value: float) -> None:
-        """Update a global parameter and propagate it to active voices."""
-        if name not in self._global_params:
+    def _apply_pending_params(self) -> None:
+        """Swap out the pending parameter snapshot and apply it."""
+        # Unlocked emptiness check: a producer that finished its update
+        # before we got here is always visible, so only the swap locks.
+        if not self._pending_params:
+            return
+        with self._params_lock:
+            pending, self._pending_params = self._pending_params, {}
+        self._handle_set_params_bulk(pending)
+
+    def _handle_set_poly_mode(self, is_poly: bool) -> None:
+        self._poly_mode = bool(is_poly)
+
+    def _handle_set_params_bulk(self, params: Dict[str, float]) -> None:
+        """Update several global parameters with one .set() per voice."""
+        current = self._global_params
+        updates = {
+            k: v
+            for k, v in params.items()
+            if k in current
+            and abs(current[k] - v) > _PARAM_EPS.get(k, _DEFAULT_PARAM_EPS)
+        }
+        if not updates:
             return
 
-        self._global_params[name] = value
+        self._global_params.update(updates)
+        self._controls_dirty = True
 
-        # Propagate to active voices
-        if self._mono_voice is not None:
-            try:
-                self._mono_voice.set(**{name: value})
-            except Exception:
-                pass
+        server = self._server
+        if server is None or not self._server_running:
+            return
 
-        for voice in list(self._poly_voices.values()):
-            try:
-                voice.set(**{name: value})
-            except Exception:
-                pass
+        # One OSC bundle for every voice: a single send, and all voices
+        # pick the change up on the same control block.
+        with server.at():
+            if self._mono_voice is not None:
+                self._mono_voice.set(**updates)
+
+            # Idle pooled voices too, so they are current when reused
+            for voice in self._voice_pool:
+                voice.set(**updates)
 
     def _handle_note_on(self, midi_note: int, velocity: int) -> None:
         """Start a note in mono or poly mode."""
@@ -397,29 +587,46 @@ class PeppermintSynthEngine:
 
         frequency = self._midi_to_hz(midi_note)
         base_amp = self._global_params.get("amp", 0.2)
-        amp = max(0.0, min(1.0, velocity / 127.0)) * base_amp
+        amp = _VEL_NORM[max(0, min(127, velocity))] * base_amp
 
         if self._poly_mode:
-            controls = dict(self._global_params)
-            controls.update({"frequency": frequency, "amp": amp, "gate": 1.0})
-            voice = self._synth_group.add_synth(
-                synthdef=peppermint_voice,
-                **controls,
-            )
+            # A re-struck note releases its old voice and starts on a
+            # different one: gate=0 and gate=1 on the same node in one
+            # bundle would land together, leaving no gate edge to
+            # retrigger the envelope. So the old voice only goes back to
+            # the pool after the new one has been chosen.
+            old = self._poly_voices.pop(midi_note, None)
+            if self._free_voices:
+                voice = self._free_voices.popleft()
+            elif self._poly_voices:
+                # Steal the oldest other sounding voice. Its gate is
+                # already open, so it glides to the new note without a
+                # fresh attack.
+                oldest = next(iter(self._poly_voices))
+                voice = self._poly_voices.pop(oldest)
+            elif old is not None:
+                # Only possible with a one-voice pool: the note carries on
+                # at the new velocity without retriggering.
+                voice = old
+            else:
+                return
+
+            # Release and start go out together as one bundle
+            with self._server.at():
+                if old is not None and old is not voice:
+                    old.set(gate=0.0)
+                    self._free_voices.append(old)
+                # Pooled voices already hold the global params
+                voice.set(frequency=frequency, amp=amp, gate=1.0)
             self._poly_voices[midi_note] = voice
         else:
             if self._mono_voice is None:
-                controls = dict(self._global_params)
-                controls.update({"frequency": frequency, "amp": amp, "gate": 1.0})
                 self._mono_voice = self._synth_group.add_synth(
                     synthdef=peppermint_voice,
-                    **controls,
+                    **self._voice_controls(frequency=frequency, amp=amp, gate=1.0),
                 )
             else:
-                try:
-                    self._mono_voice.set(frequency=frequency, amp=amp, gate=1.0)
-                except Exception:
-                    pass
+                self._mono_voice.set(frequency=frequency, amp=amp, gate=1.0)
 
     def _handle_note_off(self, midi_note: int) -> None:
         """Stop a specific note (poly) or gate-off the mono voice."""
@@ -427,31 +634,30 @@ class PeppermintSynthEngine:
             return
 
         if self._poly_mode:
-            voice = self._poly_voices.pop(midi_note, None)
-            if voice is not None:
-                try:
-                    voice.set(gate=0.0)
-                except Exception:
-                    pass
+            self._release_poly_voice(midi_note)
         else:
             if self._mono_voice is not None:
-                try:
-                    self._mono_voice.set(gate=0.0)
-                except Exception:
-                    pass
+                self._mono_voice.set(gate=0.0)
+
+    def _release_poly_voice(self, midi_note: int) -> None:
+        """Gate off the voice playing midi_note and return it to the pool."""
+        voice = self._poly_voices.pop(midi_note, None)
+        if voice is None:
+            return
+        voice.set(gate=0.0)
+        self._free_voices.append(voice)
 
     def _handle_note_off_all(self) -> None:
         """Gate off all active voices."""
-        for midi_note, voice in list(self._poly_voices.items()):
-            try:
-                voice.set(gate=0.0)
-            except Exception:
-                pass
-        self._poly_voices.clear()
+        if self._synth_group is None:
+            return
 
-        if self._mono_voice is not None:
-            try:
-                self._mono_voice.set(gate=0.0)
-            except Exception:
-                pass
-            self._mono_voice = None
+        # Every voice (pooled and mono) is in the group, so one /n_set on
+        # the group reaches them all; idle ones are already at gate=0.
+        # The mono voice is kept and reused by the next note, rather than
+        # dropped and leaked as an orphaned node.
+        self._synth_group.set(gate=0.0)
+
+        poly_voices = self._poly_voices
+        self._free_voices.extend(poly_voices.values())
+        poly_voices.clear()
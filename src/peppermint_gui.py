@@ -16,14 +16,48 @@ PyQt6 GUI for "Peppermint Synth - Roth Amplification Ltd."
 from __future__ import annotations
 
 import subprocess
-from typing import Dict
+from typing import TYPE_CHECKING, Dict, List, Tuple
 
-from PyQt6 import QtCore, QtWidgets
+from PyQt6 import QtCore, QtGui, QtWidgets
 
 from peppermint_engine import PeppermintSynthEngine
-from peppermint_midi import MidiInputManager
 from peppermint_piano import PianoWidget
-from peppermint_presets import SynthPresetManager
+
+if TYPE_CHECKING:
+    # Imported lazily at runtime (MIDI in _setup_midi, presets on first
+    # save/load) so the window can paint before mido/rtmidi load.
+    from peppermint_midi import MidiInputManager
+    from peppermint_presets import SynthPresetManager
+
+
+# Slider handle color per parameter bank. ParameterSlider uses the bank
+# name as the QSlider object name, and the window installs one shared
+# stylesheet (SLIDER_STYLESHEET) covering every bank.
+SLIDER_HANDLE_COLORS: Dict[str, str] = {
+    "vco": "#3f88ff",
+    "filter": "#ff8800",
+    "lfo": "#aa44ff",
+    "env": "#44aa44",
+    "amp": "#222222",
+}
+
+SLIDER_STYLESHEET = """
+    QSlider::groove:vertical {
+        background: #e0e0e0;
+        border: 1px solid #b0b0b0;
+        width: 10px;
+        margin: 5px 0;
+    }
+    QSlider::handle:vertical {
+        border: 1px solid #444444;
+        height: 16px;
+        margin: -4px -8px;
+        border-radius: 3px;
+    }
+""" + "".join(
+    f"QSlider#{bank}::handle:vertical {{ background: {color}; }}\n"
+    for bank, color in SLIDER_HANDLE_COLORS.items()
+) + "QLabel#bankHeader { font-weight: bold; }\n"
 
 
 class ParameterSlider(QtWidgets.QWidget):
@@ -36,6 +70,10 @@ class ParameterSlider(QtWidgets.QWidget):
 
     valueChanged = QtCore.pyqtSignal(str, float)  # (param_name, value)
 
+    # Label font shared by all instances; built on first construction
+    # (QFont needs the QApplication to exist).
+    _label_font: QtGui.QFont | None = None
+
     def __init__(
         self,
         label_text: str,
@@ -43,14 +81,18 @@ class ParameterSlider(QtWidgets.QWidget):
         min_val: float,
         max_val: float,
         default: float,
-        color: str,
+        bank: str,
         parent=None,
     ) -> None:
+        """bank selects the handle color (a key of SLIDER_HANDLE_COLORS)."""
         super().__init__(parent)
 
         self.param_name = param_name
         self.min_val = float(min_val)
         self.max_val = float(max_val)
+        # slider position (0..1000) <-> value scale factors
+        self._scale = (self.max_val - self.min_val) / 1000.0
+        self._inv_scale = 1000.0 / (self.max_val - self.min_val)
 
         self.setFixedWidth(80)
 
@@ -62,71 +104,84 @@ class ParameterSlider(QtWidgets.QWidget):
         self.label = QtWidgets.QLabel()
         self.label.setAlignment(QtCore.Qt.AlignmentFlag.AlignHCenter)
         self.label.setStyleSheet("color: black;")
-        font = self.label.font()
-        font.setPointSize(9)
-        self.label.setFont(font)
+        if ParameterSlider._label_font is None:
+            font = QtGui.QFont()
+            font.setPointSize(9)
+            ParameterSlider._label_font = font
+        self.label.setFont(ParameterSlider._label_font)
 
         self.slider = QtWidgets.QSlider(QtCore.Qt.Orientation.Vertical)
         self.slider.setRange(0, 1000)
         self.slider.setMinimumHeight(140)
-        self.slider.setStyleSheet(
-            f"""
-            QSlider::groove:vertical {{
-                background: #e0e0e0;
-                border: 1px solid #b0b0b0;
-                width: 10px;
-                margin: 5px 0;
-            }}
-            QSlider::handle:vertical {{
-                background: {color};
-                border: 1px solid #444444;
-                height: 16px;
-                margin: -4px -8px;
-                border-radius: 3px;
-            }}
-            """
-        )
+        self.slider.setObjectName(bank)
 
         layout.addWidget(self.label)
         layout.addWidget(self.slider, 1, QtCore.Qt.AlignmentFlag.AlignHCenter)
 
-        self._base_label_text = label_text
+        self._label_prefix = f"{label_text}\n"
+        # Last value set or dragged, so get_value() needs no Qt round-trip.
+        self._current_value = float(default)
+        # True while set_value() moves the slider; _on_slider_changed
+        # ignores those programmatic changes.
+        self._programmatic = False
 
         self.set_value(default, emit=False)
 
         self.slider.valueChanged.connect(self._on_slider_changed)
 
     def _slider_to_value(self, pos: int) -> float:
-        norm = pos / 1000.0
-        return self.min_val + norm * (self.max_val - self.min_val)
+        return self.min_val + pos * self._scale
 
     def _value_to_slider(self, value: float) -> int:
         clamped = max(self.min_val, min(self.max_val, float(value)))
-        norm = (clamped - self.min_val) / (self.max_val - self.min_val)
-        return int(norm * 1000)
+        return int((clamped - self.min_val) * self._inv_scale)
 
     def set_value(self, value: float, emit: bool = True) -> None:
         pos = self._value_to_slider(value)
 
-        self.slider.blockSignals(True)
-        self.slider.setValue(pos)
-        self.slider.blockSignals(False)
+        self._programmatic = True
+        try:
+            self.slider.setValue(pos)
+        finally:
+            self._programmatic = False
 
         actual = self._slider_to_value(pos)
-        self.label.setText(f"{self._base_label_text}\n{actual:.3f}")
+        self._current_value = actual
+        self.label.setText(f"{self._label_prefix}{actual:.3f}")
 
         if emit:
             self.valueChanged.emit(self.param_name, actual)
 
     def get_value(self) -> float:
-        return self._slider_to_value(self.slider.value())
+        return self._current_value
 
     def _on_slider_changed(self, pos: int) -> None:
+        if self._programmatic:
+            return
         value = self._slider_to_value(pos)
-        self.label.setText(f"{self._base_label_text}\n{value:.3f}")
+        self._current_value = value
+        self.label.setText(f"{self._label_prefix}{value:.3f}")
         self.valueChanged.emit(self.param_name, value)
 
 
+class _PortScanSignals(QtCore.QObject):
+    """Carries a finished MIDI port scan back to the GUI thread."""
+
+    finished = QtCore.pyqtSignal(list)  # port names
+
+
+class _PortScanTask(QtCore.QRunnable):
+    """Runs MidiInputManager.refresh_input_ports() on the thread pool."""
+
+    def __init__(self, manager: MidiInputManager, signals: _PortScanSignals) -> None:
+        super().__init__()
+        self._manager = manager
+        self._signals = signals
+
+    def run(self) -> None:
+        self._signals.finished.emit(self._manager.refresh_input_ports())
+
+
 class SynthControlWindow(QtWidgets.QWidget):
     """
     Main GUI window for Peppermint Synth.
@@ -137,13 +192,40 @@ class SynthControlWindow(QtWidgets.QWidget):
 
         self.engine = engine
         self.setWindowTitle("Peppermint Synth - Roth Amplification Ltd.")
-        self.setStyleSheet("background-color: white; color: black;")
+        self.setStyleSheet(
+            "* { background-color: white; color: black; }" + SLIDER_STYLESHEET
+        )
 
         self.param_sliders: Dict[str, ParameterSlider] = {}
+        # (name, slider) pairs in build order, for the per-note and preset
+        # loops that touch every slider.
+        self._param_slider_items: List[Tuple[str, ParameterSlider]] = []
+        # Last value sent to the engine per slider, to drop repeat changes
+        self._last_sent: Dict[str, float] = {}
+        # Slider changes waiting for the engine. Ticks during a drag
+        # overwrite each other (latest wins) and go out as one bulk
+        # command when the flush timer fires or the slider is released.
+        self._pending_params: Dict[str, float] = {}
+        self._flush_timer = QtCore.QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(12)
+        self._flush_timer.timeout.connect(self._flush_params)
         self.midi_manager: MidiInputManager | None = None
-        self.preset_manager = SynthPresetManager()
+        # Port rescans run on QThreadPool; results arrive via this signal
+        self._port_scan_signals = _PortScanSignals(self)
+        self._port_scan_signals.finished.connect(self._on_midi_ports_scanned)
+        # Created on first preset save/load (see _get_preset_manager)
+        self.preset_manager: SynthPresetManager | None = None
 
         self._build_ui()
+        # Plain-Python copies of the combo selections, kept current by the
+        # combo handlers so hot paths don't fetch QVariants per call.
+        self._poly_mode = bool(self.poly_mode_combo.currentData())
+        self._current_lfo_target = float(self.lfo_target_combo.currentData())
+        self._current_midi_note = int(self.note_combo.currentData())
+        # Everything starts out dirty: the first flush (slider move or
+        # note-on) syncs the engine with the panel's initial state.
+        self._pending_params.update(self._voice_params())
         self._setup_midi()
 
         self._sc_status_timer = QtCore.QTimer(self)
@@ -181,6 +263,7 @@ class SynthControlWindow(QtWidgets.QWidget):
         self.note_combo.addItem("A3 (220 Hz)", 57)
         self.note_combo.addItem("A4 (440 Hz)", 69)
         self.note_combo.addItem("A1 (55 Hz)", 33)
+        self.note_combo.currentIndexChanged.connect(self._on_note_combo_changed)
 
         self.note_on_button = QtWidgets.QPushButton("Note On")
         self.note_off_button = QtWidgets.QPushButton("Note Off")
@@ -251,7 +334,7 @@ class SynthControlWindow(QtWidgets.QWidget):
 
             header = QtWidgets.QLabel(title)
             header.setAlignment(QtCore.Qt.AlignmentFlag.AlignHCenter)
-            header.setStyleSheet("font-weight: bold; color: black;")
+            header.setObjectName("bankHeader")
             bank_layout.addWidget(header)
 
             sliders_row = QtWidgets.QHBoxLayout()
@@ -272,11 +355,13 @@ class SynthControlWindow(QtWidgets.QWidget):
             vmin: float,
             vmax: float,
             default: float,
-            color: str,
+            bank: str,
         ):
-            slider = ParameterSlider(label, param, vmin, vmax, default, color)
+            slider = ParameterSlider(label, param, vmin, vmax, default, bank)
             slider.valueChanged.connect(self._on_param_slider_changed)
+            slider.slider.sliderReleased.connect(self._flush_params)
             self.param_sliders[param] = slider
+            self._param_slider_items.append((param, slider))
             row_layout.addWidget(slider)
 
         # Column 1: VCO + FILTER
@@ -285,27 +370,27 @@ class SynthControlWindow(QtWidgets.QWidget):
 
         vco_bank, vco_row = create_centered_bank("VCO")
         add_slider(
-            vco_row, "VCO Mix\n(0=VCO1, 1=VCO2)", "vco_mix", 0.0, 1.0, 0.5, "#3f88ff"
+            vco_row, "VCO Mix\n(0=VCO1, 1=VCO2)", "vco_mix", 0.0, 1.0, 0.5, "vco"
         )
         add_slider(
-            vco_row, "VCO1 Wave\n(0=saw,1=pulse)", "vco1_wave", 0.0, 1.0, 0.0, "#3f88ff"
+            vco_row, "VCO1 Wave\n(0=saw,1=pulse)", "vco1_wave", 0.0, 1.0, 0.0, "vco"
         )
         add_slider(
-            vco_row, "VCO2 Wave\n(0=saw,1=pulse)", "vco2_wave", 0.0, 1.0, 0.0, "#3f88ff"
+            vco_row, "VCO2 Wave\n(0=saw,1=pulse)", "vco2_wave", 0.0, 1.0, 0.0, "vco"
         )
         add_slider(
-            vco_row, "Detune Ratio", "detune", 0.98, 1.08, 1.01, "#3f88ff"
+            vco_row, "Detune Ratio", "detune", 0.98, 1.08, 1.01, "vco"
         )
         col_vco_filt.addLayout(vco_bank)
 
         filt_bank, filt_row = create_centered_bank("FILTER")
-        add_slider(filt_row, "Cutoff (Hz)", "cutoff", 100.0, 8000.0, 1200.0, "#ff8800")
-        add_slider(filt_row, "Resonance (0–1)", "res", 0.0, 1.0, 0.2, "#ff8800")
+        add_slider(filt_row, "Cutoff (Hz)", "cutoff", 100.0, 8000.0, 1200.0, "filter")
+        add_slider(filt_row, "Resonance (0–1)", "res", 0.0, 1.0, 0.2, "filter")
         add_slider(
-            filt_row, "Filter Env Amount", "env_amt", 0.0, 1.0, 0.5, "#ff8800"
+            filt_row, "Filter Env Amount", "env_amt", 0.0, 1.0, 0.5, "filter"
         )
         add_slider(
-            filt_row, "Noise Mix (0–1)", "noise_mix", 0.0, 1.0, 0.0, "#ff8800"
+            filt_row, "Noise Mix (0–1)", "noise_mix", 0.0, 1.0, 0.0, "filter"
         )
         col_vco_filt.addLayout(filt_bank)
 
@@ -313,25 +398,25 @@ class SynthControlWindow(QtWidgets.QWidget):
         col_lfo = QtWidgets.QVBoxLayout()
         col_lfo.setSpacing(12)
         lfo_bank, lfo_row = create_centered_bank("LFO")
-        add_slider(lfo_row, "LFO Freq (Hz)", "lfo_freq", 0.1, 20.0, 5.0, "#aa44ff")
-        add_slider(lfo_row, "LFO Depth (0–1)", "lfo_depth", 0.0, 1.0, 0.0, "#aa44ff")
+        add_slider(lfo_row, "LFO Freq (Hz)", "lfo_freq", 0.1, 20.0, 5.0, "lfo")
+        add_slider(lfo_row, "LFO Depth (0–1)", "lfo_depth", 0.0, 1.0, 0.0, "lfo")
         col_lfo.addLayout(lfo_bank)
 
         # Column 3: ENV (ADSR)
         col_env = QtWidgets.QVBoxLayout()
         col_env.setSpacing(12)
         env_bank, env_row = create_centered_bank("ENV (ADSR)")
-        add_slider(env_row, "Attack (s)", "atk", 0.001, 2.0, 0.01, "#44aa44")
-        add_slider(env_row, "Decay (s)", "dec", 0.01, 2.0, 0.1, "#44aa44")
-        add_slider(env_row, "Sustain (0–1)", "sus", 0.0, 1.0, 0.7, "#44aa44")
-        add_slider(env_row, "Release (s)", "rel", 0.01, 4.0, 0.3, "#44aa44")
+        add_slider(env_row, "Attack (s)", "atk", 0.001, 2.0, 0.01, "env")
+        add_slider(env_row, "Decay (s)", "dec", 0.01, 2.0, 0.1, "env")
+        add_slider(env_row, "Sustain (0–1)", "sus", 0.0, 1.0, 0.7, "env")
+        add_slider(env_row, "Release (s)", "rel", 0.01, 4.0, 0.3, "env")
         col_env.addLayout(env_bank)
 
         # Column 4: AMP
         col_amp = QtWidgets.QVBoxLayout()
         col_amp.setSpacing(12)
         amp_bank, amp_row = create_centered_bank("AMP")
-        add_slider(amp_row, "Level", "amp", 0.0, 0.8, 0.2, "#222222")
+        add_slider(amp_row, "Level", "amp", 0.0, 0.8, 0.2, "amp")
         col_amp.addLayout(amp_bank)
 
         panel_layout.addStretch(1)
@@ -349,6 +434,8 @@ class SynthControlWindow(QtWidgets.QWidget):
         main_layout.addWidget(self.piano_widget)
 
     def _setup_midi(self) -> None:
+        from peppermint_midi import MidiInputManager
+
         self.midi_manager = MidiInputManager(
             note_on_cb=self.engine.note_on,
             note_off_cb=self.engine.note_off,
@@ -356,23 +443,20 @@ class SynthControlWindow(QtWidgets.QWidget):
         )
         self._populate_midi_ports()
 
-    def _populate_midi_ports(self) -> None:
+    def _populate_midi_ports(self, ports: List[str] | None = None) -> None:
         if self.midi_manager is None:
             return
 
-        ports = self.midi_manager.list_input_ports()
+        if ports is None:
+            ports = self.midi_manager.list_input_ports()
         current = self.midi_manager.current_port_name
 
-        self.midi_port_combo.blockSignals(True)
-        self.midi_port_combo.clear()
-
-        for name in ports:
-            self.midi_port_combo.addItem(name, name)
-
-        if current and current in ports:
-            self.midi_port_combo.setCurrentIndex(ports.index(current))
+        with QtCore.QSignalBlocker(self.midi_port_combo):
+            self.midi_port_combo.clear()
+            self.midi_port_combo.addItems(ports)
 
-        self.midi_port_combo.blockSignals(False)
+            if current and current in ports:
+                self.midi_port_combo.setCurrentIndex(ports.index(current))
 
     def _poll_sc_status(self) -> None:
         if self.engine.is_server_running():
@@ -385,44 +469,82 @@ class SynthControlWindow(QtWidgets.QWidget):
     # ----- event handlers -----
 
     def _on_poly_mode_changed(self) -> None:
-        is_poly = bool(self.poly_mode_combo.currentData())
-        self.engine.set_poly_mode(is_poly)
+        self._poly_mode = bool(self.poly_mode_combo.currentData())
+        self.engine.set_poly_mode(self._poly_mode)
 
     def _on_lfo_target_changed(self) -> None:
-        value = float(self.lfo_target_combo.currentData())
-        self.engine.set_param("lfo_target", value)
+        self._current_lfo_target = float(self.lfo_target_combo.currentData())
+        self.engine.set_param("lfo_target", self._current_lfo_target)
+
+    def _on_note_combo_changed(self) -> None:
+        self._current_midi_note = int(self.note_combo.currentData())
 
     def _on_param_slider_changed(self, param_name: str, value: float) -> None:
-        self.engine.set_param(param_name, value)
+        prev = self._last_sent.get(param_name)
+        if prev is not None and abs(prev - value) < 1e-6:
+            return
+        self._last_sent[param_name] = value
+        self._pending_params[param_name] = value
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def _flush_params(self) -> None:
+        """Send all pending slider changes to the engine at once."""
+        self._flush_timer.stop()
+        if not self._pending_params:
+            return
+        params, self._pending_params = self._pending_params, {}
+        self.engine.set_params_bulk(params)
+
+    def _voice_params(self) -> Dict[str, float]:
+        """Current slider values plus LFO target (the full panel state)."""
+        params = {name: slider.get_value() for name, slider in self._param_slider_items}
+        params["lfo_target"] = self._current_lfo_target
+        return params
 
     def _on_note_on_button(self) -> None:
-        midi_note = int(self.note_combo.currentData())
+        midi_note = self._current_midi_note
+        # The engine already holds every parameter for new voices; only
+        # changes still waiting in the coalescing buffer need to go out.
+        self._flush_params()
         self.engine.note_on(midi_note, velocity=100)
-        for name, slider in self.param_sliders.items():
-            self.engine.set_param(name, slider.get_value())
-        self.engine.set_param("lfo_target", float(self.lfo_target_combo.currentData()))
 
     def _on_note_off_button(self) -> None:
         self.engine.note_off_all()
 
     def _on_piano_note_on(self, midi_note: int) -> None:
+        self._flush_params()
         self.engine.note_on(midi_note, velocity=100)
-        for name, slider in self.param_sliders.items():
-            self.engine.set_param(name, slider.get_value())
-        self.engine.set_param("lfo_target", float(self.lfo_target_combo.currentData()))
 
     def _on_piano_note_off(self, midi_note: int) -> None:
         self.engine.note_off(midi_note)
 
     def _on_midi_refresh(self) -> None:
-        self._populate_midi_ports()
+        if self.midi_manager is None:
+            return
+        # Scanning devices can take tens of ms; do it off the GUI thread.
+        self.midi_refresh_button.setEnabled(False)
+        QtCore.QThreadPool.globalInstance().start(
+            _PortScanTask(self.midi_manager, self._port_scan_signals)
+        )
+
+    def _on_midi_ports_scanned(self, ports: List[str]) -> None:
+        self.midi_refresh_button.setEnabled(True)
+        self._populate_midi_ports(ports)
 
     def _on_midi_port_changed(self) -> None:
         if self.midi_manager is None:
             return
-        name = self.midi_port_combo.currentData()
+        name = self.midi_port_combo.currentText()
         if name:
-            self.midi_manager.open_port_by_name(str(name))
+            self.midi_manager.open_port_by_name(name)
+
+    def _get_preset_manager(self) -> SynthPresetManager:
+        if self.preset_manager is None:
+            from peppermint_presets import SynthPresetManager
+
+            self.preset_manager = SynthPresetManager()
+        return self.preset_manager
 
     def _on_save_preset(self) -> None:
         path, _ = QtWidgets.QFileDialog.getSaveFileName(
@@ -432,9 +554,9 @@ class SynthControlWindow(QtWidgets.QWidget):
             return
 
         preset = {
-            "sliders": {name: slider.get_value() for name, slider in self.param_sliders.items()},
-            "poly_mode": bool(self.poly_mode_combo.currentData()),
-            "lfo_target": float(self.lfo_target_combo.currentData()),
+            "sliders": {name: slider.get_value() for name, slider in self._param_slider_items},
+            "poly_mode": self._poly_mode,
+            "lfo_target": self._current_lfo_target,
             "note_index": int(self.note_combo.currentIndex()),
             "midi_port": (
                 self.midi_manager.current_port_name if self.midi_manager else None
@@ -442,7 +564,7 @@ class SynthControlWindow(QtWidgets.QWidget):
         }
 
         try:
-            self.preset_manager.save_preset_to_file(path, preset)
+            self._get_preset_manager().save_preset_to_file(path, preset)
         except Exception as exc:
             QtWidgets.QMessageBox.critical(self, "Error Saving Preset", str(exc))
 
@@ -453,23 +575,28 @@ class SynthControlWindow(QtWidgets.QWidget):
         if not path:
             return
         try:
-            preset = self.preset_manager.load_preset_from_file(path)
+            preset = self._get_preset_manager().load_preset_from_file(path)
         except Exception as exc:
             QtWidgets.QMessageBox.critical(self, "Error Loading Preset", str(exc))
             return
 
         poly_mode = bool(preset.get("poly_mode", False))
-        self.poly_mode_combo.setCurrentIndex(1 if poly_mode else 0)
-        self.engine.set_poly_mode(poly_mode)
-
         lfo_target = float(preset.get("lfo_target", 0.0))
-        idx = 0 if lfo_target < 0.5 else 1
-        self.lfo_target_combo.setCurrentIndex(idx)
-        self.engine.set_param("lfo_target", lfo_target)
-
         note_index = int(preset.get("note_index", 0))
-        if 0 <= note_index < self.note_combo.count():
-            self.note_combo.setCurrentIndex(note_index)
+
+        # Set the combos silently; the engine gets one poly-mode command
+        # and one bulk parameter push below instead of a handler per combo.
+        with QtCore.QSignalBlocker(self.poly_mode_combo), QtCore.QSignalBlocker(
+            self.lfo_target_combo
+        ), QtCore.QSignalBlocker(self.note_combo):
+            self.poly_mode_combo.setCurrentIndex(1 if poly_mode else 0)
+            self.lfo_target_combo.setCurrentIndex(0 if lfo_target < 0.5 else 1)
+            if 0 <= note_index < self.note_combo.count():
+                self.note_combo.setCurrentIndex(note_index)
+        self._poly_mode = poly_mode
+        self._current_lfo_target = float(self.lfo_target_combo.currentData())
+        self._current_midi_note = int(self.note_combo.currentData())
+        self.engine.set_poly_mode(poly_mode)
 
         if self.midi_manager:
             midi_port = preset.get("midi_port")
@@ -477,11 +604,19 @@ class SynthControlWindow(QtWidgets.QWidget):
                 self.midi_manager.open_port_by_name(midi_port)
             self._populate_midi_ports()
 
+        # Start from anything not yet flushed so it isn't lost, then let
+        # the preset override it.
+        params: Dict[str, float] = dict(self._pending_params)
+        params["lfo_target"] = lfo_target
         for name, value in preset.get("sliders", {}).items():
             slider = self.param_sliders.get(name)
             if slider is not None:
                 slider.set_value(float(value), emit=False)
-                self.engine.set_param(name, float(value))
+                params[name] = float(value)
+        self._flush_timer.stop()
+        self._pending_params.clear()
+        self._last_sent.update(params)
+        self.engine.set_params_bulk(params)
 
     # ----- JACK + Reboot SC -----
 
@@ -9,7 +9,8 @@ This version restores a class named **MidiInputManager** with the
 API expected by ``peppermint_gui.py``:
 
     - MidiInputManager(note_on_cb, note_off_cb, auto_open_first=True)
-    - list_input_ports() -> list[str]
+    - list_input_ports(max_age=1.0) -> list[str]   (briefly cached)
+    - refresh_input_ports() -> list[str]          (forces a rescan)
     - current_port_name  (str | None attribute)
     - open_port_by_name(name: str) -> None
     - shutdown() -> None
@@ -27,12 +28,18 @@ directly; the GUI passes callbacks from PeppermintSynthEngine.
 
 from __future__ import annotations
 
+import logging
 import threading
 import time
-from typing import Callable, List, Optional
+from typing import Callable, List, Optional, Tuple
 
 import mido
 
+# Diagnostics go through logging (silent unless the application configures
+# a handler) rather than print(), so the MIDI thread never blocks on stdout.
+_log = logging.getLogger("peppermint.midi")
+_log.addHandler(logging.NullHandler())
+
 
 class MidiInputManager:
     """Background MIDI input manager with a simple callback-based API.
@@ -70,6 +77,9 @@ class MidiInputManager:
         self._input_port: Optional[mido.ports.BaseInput] = None
         self.current_port_name: Optional[str] = None
 
+        # (monotonic timestamp, port names) of the last port scan
+        self._ports_cache: Optional[Tuple[float, List[str]]] = None
+
         # If requested, open the first available input port
         if auto_open_first:
             self._open_first_available_port()
@@ -86,14 +96,34 @@ class MidiInputManager:
     # Public API used by peppermint_gui.SynthControlWindow
     # ------------------------------------------------------------------
 
-    def list_input_ports(self) -> List[str]:
-        """Return a list of available MIDI input port names."""
+    def list_input_ports(self, max_age: float = 1.0) -> List[str]:
+        """Return a list of available MIDI input port names.
+
+        Enumerating ports makes the MIDI backend scan every device, so a
+        result younger than ``max_age`` seconds is reused; pass 0 (or
+        call refresh_input_ports()) to force a new scan.
+        """
+        cached = self._ports_cache
+        if cached is not None and time.monotonic() - cached[0] < max_age:
+            return list(cached[1])
+
         try:
-            return mido.get_input_names()
+            names = list(mido.get_input_names())
         except Exception as exc:
-            print("[MIDI] Failed to list input ports:", exc)
+            _log.warning("Failed to list input ports: %s", exc)
             return []
 
+        self._ports_cache = (time.monotonic(), names)
+        return list(names)
+
+    def refresh_input_ports(self) -> List[str]:
+        """Rescan MIDI input ports, bypassing the cache.
+
+        Safe to call from a worker thread; the GUI uses it to refresh the
+        port list without blocking the event loop.
+        """
+        return self.list_input_ports(max_age=0.0)
+
     def open_port_by_name(self, name: str) -> None:
         """Close any existing input and open the named MIDI input port."""
         # Close previous port if any
@@ -106,14 +136,14 @@ class MidiInputManager:
         try:
             port = mido.open_input(name)
         except Exception as exc:
-            print(f"[MIDI] Failed to open MIDI input port {name!r}: {exc}")
+            _log.warning("Failed to open MIDI input port %r: %s", name, exc)
             self.current_port_name = None
             self._input_port = None
             return
 
         self._input_port = port
         self.current_port_name = name
-        print(f"[MIDI] Opened input port: {name!r}")
+        _log.info("Opened input port: %r", name)
 
     def shutdown(self) -> None:
         """Stop the background thread and close any open ports."""
@@ -137,7 +167,7 @@ class MidiInputManager:
         """Open the first available MIDI input port, if any exist."""
         names = self.list_input_ports()
         if not names:
-            print("[MIDI] No MIDI input ports available to auto-open.")
+            _log.info("No MIDI input ports available to auto-open.")
             return
 
         first = names[0]
@@ -154,29 +184,27 @@ class MidiInputManager:
         self.current_port_name = None
 
     def _handle_message(self, msg: mido.Message) -> None:
-        """Decode one Mido message and invoke user callbacks."""
-        try:
-            if msg.type == "note_on":
-                # Velocity 0 is a 'note_off' in MIDI semantics
-                if msg.velocity > 0:
-                    if self._note_on_cb:
-                        self._note_on_cb(msg.note, msg.velocity)
-                else:
-                    if self._note_off_cb:
-                        self._note_off_cb(msg.note)
-
-            elif msg.type == "note_off":
-                if self._note_off_cb:
-                    self._note_off_cb(msg.note)
-
-            # Extend here (CC, pitch bend, etc.) if desired:
-            # elif msg.type == "control_change":
-            #     ...
-            # elif msg.type == "pitchwheel":
-            #     ...
+        """Decode one Mido message and invoke user callbacks.
 
-        except Exception as exc:
-            print(f"[MIDI] Error while handling message {msg!r}: {exc}")
+        Called from _thread_main, which owns the (single) exception guard
+        for a whole batch of pending messages.
+        """
+        kind = msg.type
+        if kind == "note_on":
+            # Velocity 0 is a 'note_off' in MIDI semantics
+            vel = msg.velocity
+            if vel > 0:
+                self._note_on_cb(msg.note, vel)
+            else:
+                self._note_off_cb(msg.note)
+        elif kind == "note_off":
+            self._note_off_cb(msg.note)
+
+        # Extend here (CC, pitch bend, etc.) if desired:
+        # elif kind == "control_change":
+        #     ...
+        # elif kind == "pitchwheel":
+        #     ...
 
     # ------------------------------------------------------------------
     # Background thread
@@ -191,7 +219,7 @@ class MidiInputManager:
             - Dispatches them to _handle_message().
             - Sleeps briefly to avoid busy-waiting.
         """
-        print("[MIDI] MIDI thread started.")
+        _log.debug("MIDI thread started.")
 
         while self._running:
             port = self._input_port
@@ -202,15 +230,18 @@ class MidiInputManager:
                         self._handle_message(msg)
                 except (IOError, OSError) as exc:
                     # Port may have disappeared; drop it and try again later.
-                    print("[MIDI] Port error, closing current port:", exc)
+                    _log.warning("Port error, closing current port: %s", exc)
                     self._close_current_port()
+                except Exception as exc:
+                    # A callback failed; keep the MIDI thread alive.
+                    _log.exception("Error while handling MIDI input: %s", exc)
 
             # Use time.sleep (NOT mido.sleep) to avoid hammering the CPU
             time.sleep(0.001)
 
-        print("[MIDI] MIDI thread stopping; closing port...")
+        _log.debug("MIDI thread stopping; closing port...")
         self._close_current_port()
-        print("[MIDI] MIDI thread exited.")
+        _log.debug("MIDI thread exited.")
 
 
 __all__ = ["MidiInputManager"]
@@ -18,6 +18,26 @@ from PyQt6 import QtCore, QtWidgets
 WHITE_PITCH_CLASSES = {0, 2, 4, 5, 7, 9, 11}
 BLACK_PITCH_CLASSES = {1, 3, 6, 8, 10}
 
+# One stylesheet for all keys, selected by object name ("white"/"black")
+KEYS_STYLESHEET = """
+    QPushButton#white {
+        background-color: #fdfdfd;
+        border: 2px solid #444444;
+        border-radius: 3px;
+    }
+    QPushButton#white:pressed {
+        background-color: #e0e0e0;
+    }
+    QPushButton#black {
+        background-color: black;
+        border: 2px solid #000000;
+        border-radius: 3px;
+    }
+    QPushButton#black:pressed {
+        background-color: #444444;
+    }
+"""
+
 
 class PianoWidget(QtWidgets.QWidget):
     """
@@ -43,6 +63,7 @@ class PianoWidget(QtWidgets.QWidget):
             raise ValueError("low_note must be a white key (C, D, E, F, G, A, B).")
 
         self.setMinimumHeight(140)
+        self.setStyleSheet(KEYS_STYLESHEET)
 
         self.white_keys: List[Dict] = []
         self.black_keys: List[Dict] = []
@@ -71,20 +92,10 @@ class PianoWidget(QtWidgets.QWidget):
                 btn = QtWidgets.QPushButton(self)
                 btn.setText("")
                 btn.setFocusPolicy(QtCore.Qt.FocusPolicy.NoFocus)
-                btn.setStyleSheet(
-                    """
-                    QPushButton {
-                        background-color: #fdfdfd;
-                        border: 2px solid #444444;
-                        border-radius: 3px;
-                    }
-                    QPushButton:pressed {
-                        background-color: #e0e0e0;
-                    }
-                    """
-                )
-                btn.pressed.connect(lambda n=note: self._on_key_pressed(n))
-                btn.released.connect(lambda n=note: self._on_key_released(n))
+                btn.setObjectName("white")
+                btn.setProperty("midi", note)
+                btn.pressed.connect(self._any_key_pressed)
+                btn.released.connect(self._any_key_released)
 
                 last_white_index += 1
                 white_note_to_index[note] = last_white_index
@@ -103,20 +114,10 @@ class PianoWidget(QtWidgets.QWidget):
                 btn = QtWidgets.QPushButton(self)
                 btn.setText("")
                 btn.setFocusPolicy(QtCore.Qt.FocusPolicy.NoFocus)
-                btn.setStyleSheet(
-                    """
-                    QPushButton {
-                        background-color: black;
-                        border: 2px solid #000000;
-                        border-radius: 3px;
-                    }
-                    QPushButton:pressed {
-                        background-color: #444444;
-                    }
-                    """
-                )
-                btn.pressed.connect(lambda n=note: self._on_key_pressed(n))
-                btn.released.connect(lambda n=note: self._on_key_released(n))
+                btn.setObjectName("black")
+                btn.setProperty("midi", note)
+                btn.pressed.connect(self._any_key_pressed)
+                btn.released.connect(self._any_key_released)
 
                 self.black_keys.append(
                     {"note": note, "left_index": last_white_index, "button": btn}
@@ -172,6 +173,13 @@ class PianoWidget(QtWidgets.QWidget):
     # Callbacks
     # ------------------------------------------------------------------
 
+    def _any_key_pressed(self) -> None:
+        # Shared slot for every key; the MIDI note is stored on the button.
+        self._on_key_pressed(int(self.sender().property("midi")))
+
+    def _any_key_released(self) -> None:
+        self._on_key_released(int(self.sender().property("midi")))
+
     def _on_key_pressed(self, note: int) -> None:
         if self.note_on_cb:
             self.note_on_cb(note)
@@ -4,6 +4,10 @@
 peppermint_presets.py
 ----------------------------------------------------------------------
 Simple JSON-based preset save / load for Peppermint Synth.
+
+Uses the optional `orjson` package when installed and the stdlib
+`json` module otherwise; both write the same layout (UTF-8, 2-space
+indent, sorted keys), so a re-saved preset diffs cleanly.
 """
 
 from __future__ import annotations
@@ -11,6 +15,25 @@ from __future__ import annotations
 import json
 from typing import Any, Dict
 
+try:
+    import orjson
+    _ORJSON_AVAILABLE = True
+except ImportError:  # pragma: no cover - environment-dependent
+    orjson = None
+    _ORJSON_AVAILABLE = False
+
+
+def _dumps(obj: Dict[str, Any]) -> bytes:
+    if _ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
+    return json.dumps(obj, indent=2, sort_keys=True, ensure_ascii=False).encode("utf-8")
+
+
+def _loads(data: bytes) -> Dict[str, Any]:
+    if _ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
 
 class SynthPresetManager:
     """
@@ -26,10 +49,10 @@ class SynthPresetManager:
 
     @staticmethod
     def save_preset_to_file(path: str, preset: Dict[str, Any]) -> None:
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(preset, f, indent=2)
+        with open(path, "wb") as f:
+            f.write(_dumps(preset))
 
     @staticmethod
     def load_preset_from_file(path: str) -> Dict[str, Any]:
-        with open(path, "r", encoding="utf-8") as f:
-            return json.load(f)
+        with open(path, "rb") as f:
+            return _loads(f.read())